@@ -2,6 +2,8 @@ from random import randint
 import pygame
 import sys
 import os
+from text_cache import CachedText
+from profiler import FrameProfiler, get_csv_path
 
 
 def resource_path(relative_path):
@@ -51,12 +53,19 @@ WHITE = (255, 255, 255)
 # fonts
 font = pygame.font.Font(resource_path('resources/WashYourHand.ttf'), 32)
 
+# HUD text, rendered again only when its value changes
+points_hud = CachedText(font, 'Burger Points: {}', True, ORANGE)
+score_hud = CachedText(font, 'Score: {}', True, ORANGE)
+eaten_hud = CachedText(font, 'Burgers Eaten: {}', True, ORANGE)
+lifes_hud = CachedText(font, 'Lifes: {}', True, ORANGE)
+boost_hud = CachedText(font, 'Boost: {}', True, ORANGE)
+
 # text
-points_text = font.render(f'Burger Points: {burger_points}', True, ORANGE)
+points_text = points_hud.render(burger_points)
 points_rect = points_text.get_rect()
 points_rect.topleft = (10, 10)
 
-score_text = font.render(f'Score: {score}', True, ORANGE)
+score_text = score_hud.render(score)
 score_rect = score_text.get_rect()
 score_rect.topleft = (10, 50)
 
@@ -64,15 +73,15 @@ title_text = font.render('Burger Dog', True, ORANGE)
 title_rect = title_text.get_rect()
 title_rect.center = (WINDOW_WIDTH//2, 25)
 
-eaten_text = font.render(f'Burgers Eaten: {burgers_eaten}', True, ORANGE)
+eaten_text = eaten_hud.render(burgers_eaten)
 eaten_rect = eaten_text.get_rect()
 eaten_rect.center = (WINDOW_WIDTH//2, 65)
 
-lifes_text = font.render(f'Lifes: {player_lifes}', True, ORANGE)
+lifes_text = lifes_hud.render(player_lifes)
 lifes_rect = lifes_text.get_rect()
 lifes_rect.topright = (WINDOW_WIDTH-10, 10)
 
-boost_text = font.render(f'Boost: {boost_value}', True, ORANGE)
+boost_text = boost_hud.render(boost_value)
 boost_rect = boost_text.get_rect()
 boost_rect.topright = (WINDOW_WIDTH-10, 50)
 
@@ -100,12 +109,17 @@ burger_img = pygame.image.load(resource_path('resources/burger.png'))
 burger_rect = burger_img.get_rect()
 burger_rect.topleft = (randint(0, WINDOW_WIDTH-32), BUFFER)
 
+# F3 shows frame times, '--profile-csv <file>' saves them
+profiler = FrameProfiler(get_csv_path())
+
 # main game loop
 pygame.mixer.music.play()
 result = False
 running = True
 while running:
+    profiler.start_frame()
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
 
@@ -121,6 +135,7 @@ while running:
             dog_rect.center = (WINDOW_WIDTH//2, WINDOW_HEIGHT-50)
             pygame.mixer.music.play()
             result = False
+    profiler.mark('events')
 
     # move the dog
     keys = pygame.key.get_pressed()
@@ -161,6 +176,7 @@ while running:
         burger_speed = STARTING_BURGER_SPEED
         boost_value = STARTING_BOOST_VALUE
         dog_rect.center = (WINDOW_WIDTH//2, WINDOW_HEIGHT-50)
+    profiler.mark('update')
 
     # check for collision
     if dog_rect.colliderect(burger_rect):
@@ -172,13 +188,14 @@ while running:
         boost_value += 25
         if boost_value > STARTING_BOOST_VALUE:
             boost_value = STARTING_BOOST_VALUE
+    profiler.mark('collision')
 
     # update HUD
-    boost_text = font.render(f'Boost: {boost_value}', True, ORANGE)
-    points_text = font.render(f'Burger Points: {burger_points}', True, ORANGE)
-    eaten_text = font.render(f'Burgers Eaten: {burgers_eaten}', True, ORANGE)
-    score_text = font.render(f'Score: {score}', True, ORANGE)
-    lifes_text = font.render(f'Lifes: {player_lifes}', True, ORANGE)
+    boost_text = boost_hud.render(boost_value)
+    points_text = points_hud.render(burger_points)
+    eaten_text = eaten_hud.render(burgers_eaten)
+    score_text = score_hud.render(score)
+    lifes_text = lifes_hud.render(player_lifes)
 
     # fill the background
     window.fill(BLACK)
@@ -202,9 +219,17 @@ while running:
         window.blit(game_over_text, game_over_rect)
         window.blit(continue_text, continue_rect)
 
+    # draw the profiler overlay
+    profiler.draw(window)
+    profiler.mark('draw')
+
     # update the window and tick the clock
     pygame.display.update()
+    profiler.mark('flip')
     clock.tick(FPS)
+    profiler.mark('wait')
+    profiler.end_frame()
 
 
+profiler.close()
 pygame.quit()
@@ -2,6 +2,8 @@ from random import choice
 import pygame
 import os
 import sys
+from text_cache import CachedText
+from profiler import FrameProfiler, get_csv_path
 
 
 def resource_path(relative_path):
@@ -60,16 +62,20 @@ bg_music = pygame.mixer.music.load(resource_path('resources/bg_music.wav'))
 # loading fonts
 font = pygame.font.Font(resource_path('resources/Franxurter.ttf'), 32)
 
+# HUD text, rendered again only when its value changes
+score_hud = CachedText(font, 'Score: {}', True, YELLOW)
+lifes_hud = CachedText(font, 'Lifes: {}', True, YELLOW)
+
 # defining text
 title_text = font.render('Catch The Clown', True, CYAN)
 title_rect = title_text.get_rect()
 title_rect.topleft = (20, 10)
 
-score_text = font.render(f'Score: {score}', True, YELLOW)
+score_text = score_hud.render(score)
 score_rect = score_text.get_rect()
 score_rect.topright = (WINDOW_WIDTH-20, 10)
 
-lifes_text = font.render(f'Lifes: {lifes}', True, YELLOW)
+lifes_text = lifes_hud.render(lifes)
 lifes_rect = lifes_text.get_rect()
 lifes_rect.topright = (WINDOW_WIDTH-20, 42)
 
@@ -84,11 +90,16 @@ continue_rect.center = (WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 32)
 # play background music
 pygame.mixer.music.play(-1, 0.0)
 
+# F3 shows frame times, '--profile-csv <file>' saves them
+profiler = FrameProfiler(get_csv_path())
+
 # game main loop
 result = False
 running = True
 while running:
+    profiler.start_frame()
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.MOUSEBUTTONDOWN and not result:
@@ -116,6 +127,7 @@ while running:
             direction_y = DIRECTION
             pygame.mixer.music.play(-1, 0.0)
             result = False
+    profiler.mark('events')
 
     # blitting images
     window.blit(bg_img, bg_rect)
@@ -127,26 +139,37 @@ while running:
     window.blit(lifes_text, lifes_rect)
 
     # updaing score and lifes
-    lifes_text = font.render(f'Lifes: {lifes}', True, YELLOW)
-    score_text = font.render(f'Score: {score}', True, YELLOW)
+    lifes_text = lifes_hud.render(lifes)
+    score_text = score_hud.render(score)
+    profiler.mark('draw')
 
     # move the clown xD
     if not result:
         clown_rect.x += speed * direction_x
         clown_rect.y += speed * direction_y
+    profiler.mark('update')
 
     # check bounce
     if clown_rect.y > WINDOW_HEIGHT-64 or clown_rect.y < 0:
         direction_y *= -1
     if clown_rect.x > WINDOW_WIDTH-64 or clown_rect.x < 0:
         direction_x *= -1
+    profiler.mark('collision')
 
     if result:
         window.blit(game_over_text, game_over_rect)
         window.blit(continue_text, continue_rect)
 
+    # draw the profiler overlay
+    profiler.draw(window)
+    profiler.mark('draw')
+
     # update screen and tick the clock
     pygame.display.update()
+    profiler.mark('flip')
     clock.tick(FPS)
+    profiler.mark('wait')
+    profiler.end_frame()
 
+profiler.close()
 pygame.quit()
@@ -2,6 +2,8 @@ from random import randint
 import pygame
 import os
 import sys
+from text_cache import CachedText
+from profiler import FrameProfiler, get_csv_path
 
 
 def resource_path(relative_path):
@@ -50,16 +52,20 @@ title_font = pygame.font.Font(
 score_lifes_font = pygame.font.Font(
     resource_path('resources/DanceToday.otf'), 30)
 
+# HUD text, rendered again only when its value changes
+score_hud = CachedText(score_lifes_font, 'Score {}', True, (255, 255, 255))
+lifes_hud = CachedText(score_lifes_font, 'Lifes {}', True, (255, 0, 0))
+
 # define text
 title = title_font.render('Feed The Dragon', True, (37, 180, 44))
 title_rect = title.get_rect()
 title_rect.center = (WINDOW_WIDTH//2, 22)
 
-score_text = score_lifes_font.render(f'Score {score}', True, (255, 255, 255))
+score_text = score_hud.render(score)
 score_rect = score_text.get_rect()
 score_rect.topleft = (25, 10)
 
-lifes_text = score_lifes_font.render(f'Lifes {lifes}', True, (255, 0, 0))
+lifes_text = lifes_hud.render(lifes)
 lifes_rect = lifes_text.get_rect()
 lifes_rect.topright = (WINDOW_WIDTH-25, 10)
 
@@ -86,11 +92,16 @@ miss.set_volume(.5)
 # play background music
 pygame.mixer.music.play(-1, 0.0)
 
+# F3 shows frame times, '--profile-csv <file>' saves them
+profiler = FrameProfiler(get_csv_path())
+
 running = True
 result = False
 while running:
+    profiler.start_frame()
     # loop over events
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.KEYDOWN and result:
@@ -99,6 +110,7 @@ while running:
             food_speed = STARTING_FOOD_SPEED
             result = False
             pygame.mixer.music.play(-1, 0.0)
+    profiler.mark('events')
 
     # getting keys being hold
     keys = pygame.key.get_pressed()
@@ -107,6 +119,7 @@ while running:
         dragon_rect.y -= PLAYER_VELOCITY
     if (keys[pygame.K_s] or keys[pygame.K_DOWN]) and dragon_rect.bottom < WINDOW_HEIGHT:
         dragon_rect.y += PLAYER_VELOCITY
+    profiler.mark('update')
 
     # check collision
     if dragon_rect.colliderect(food_rect):
@@ -125,15 +138,14 @@ while running:
             lifes = 0
             pygame.mixer.music.stop()
             result = True
+    profiler.mark('collision')
 
     # wipe old screen
     window.fill((0, 0, 0))
 
     # changing score and life
-    score_text = score_lifes_font.render(
-        f'Score {score}', True, (255, 255, 255))
-    lifes_text = score_lifes_font.render(
-        f'Lifes {lifes}', True, (255, 0, 0))
+    score_text = score_hud.render(score)
+    lifes_text = lifes_hud.render(lifes)
 
     # blitting images and text
     window.blit(dragon_image, dragon_rect)
@@ -145,10 +157,12 @@ while running:
 
     # draw line
     pygame.draw.line(window, (255, 255, 255), (0, 50), (WINDOW_WIDTH, 50), 5)
+    profiler.mark('draw')
 
     # move food
     if not result:
         food_rect.x -= food_speed
+    profiler.mark('update')
 
     # check if lost
     if result:
@@ -161,9 +175,17 @@ while running:
                 lifes = STARTING_LIFES
                 food_speed = STARTING_FOOD_SPEED
 
+    # draw the profiler overlay
+    profiler.draw(window)
+    profiler.mark('draw')
+
     pygame.display.update()
+    profiler.mark('flip')
 
     clock.tick(FPS)
+    profiler.mark('wait')
+    profiler.end_frame()
 
 
+profiler.close()
 pygame.quit()
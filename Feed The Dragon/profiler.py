@@ -0,0 +1,143 @@
+import csv
+import sys
+import time
+import atexit
+from collections import deque
+import pygame
+from text_cache import text_cache
+
+
+def get_csv_path():
+    """ Get the file after '--profile-csv' on the command line, or None """
+    if '--profile-csv' in sys.argv:
+        return sys.argv[sys.argv.index('--profile-csv') + 1]
+    return None
+
+
+class FrameProfiler:
+    """ Times the phases of every frame, shows p50/p95/p99 frame times on an overlay and streams samples to a CSV """
+
+    PHASES = ('events', 'update', 'collision', 'draw', 'flip', 'wait')
+
+    def __init__(self, csv_path=None, history=300, toggle_key=pygame.K_F3):
+        """ Initialize the profiler, F3 shows and hides the overlay """
+        self.history = history
+        self.toggle_key = toggle_key
+
+        # milliseconds per phase of the frame being timed
+        self.phase_times = dict.fromkeys(self.PHASES, 0.0)
+        self.last_phase_times = dict.fromkeys(self.PHASES, 0.0)
+        self.phase_start = time.perf_counter()
+        self.frame_count = 0
+
+        # the last frames, whole frame time and time spent working (everything but the wait for the next frame)
+        self.frame_times = deque(maxlen=history)
+        self.work_times = deque(maxlen=history)
+        self.phase_totals = dict.fromkeys(self.PHASES, 0.0)
+
+        # overlay, its text is only rendered again a few times a second
+        self.is_visible = False
+        self.font = None
+        self.overlay = None
+        self.overlay_interval = 15
+
+        self.csv_file = None
+        self.csv_writer = None
+        if csv_path:
+            self.csv_file = open(csv_path, 'w', newline='')
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(['frame', 'frame_ms', 'work_ms'] + [f'{phase}_ms' for phase in self.PHASES])
+            # games quit with sys.exit from their pause screens, close the file however they end
+            atexit.register(self.close)
+
+    def start_frame(self):
+        """ Start timing a frame, call at the top of the game loop """
+        for phase in self.PHASES:
+            self.phase_times[phase] = 0.0
+        self.phase_start = time.perf_counter()
+
+    def mark(self, phase):
+        """ End a phase, the time since the last mark is added to it """
+        now = time.perf_counter()
+        self.phase_times[phase] += (now - self.phase_start) * 1000
+        self.phase_start = now
+
+    def end_frame(self):
+        """ Finish timing a frame, call at the bottom of the game loop """
+        frame_time = sum(self.phase_times.values())
+        work_time = frame_time - self.phase_times['wait']
+
+        self.frame_count += 1
+        self.frame_times.append(frame_time)
+        self.work_times.append(work_time)
+        for phase in self.PHASES:
+            self.phase_totals[phase] += self.phase_times[phase]
+        self.last_phase_times.update(self.phase_times)
+
+        if self.csv_writer:
+            self.csv_writer.writerow([self.frame_count, f'{frame_time:.3f}', f'{work_time:.3f}'] +
+                                     [f'{self.phase_times[phase]:.3f}' for phase in self.PHASES])
+
+        if self.is_visible and not self.frame_count % self.overlay_interval:
+            self.overlay = None
+
+    def handle_event(self, event):
+        """ Show or hide the overlay on the toggle key """
+        if event.type == pygame.KEYDOWN and event.key == self.toggle_key:
+            self.is_visible = not self.is_visible
+            self.overlay = None
+
+    @staticmethod
+    def get_percentiles(samples, percents=(50, 95, 99)):
+        """ Get the percentiles of the samples, nearest rank """
+        ordered = sorted(samples)
+        if not ordered:
+            return [0.0 for percent in percents]
+
+        return [ordered[min(len(ordered) - 1, len(ordered) * percent // 100)] for percent in percents]
+
+    def stats(self):
+        """ Report the frame and work time percentiles, the mean time of each phase in milliseconds and the text
+        cache stats """
+        frames = max(self.frame_count, 1)
+        return {'frames': self.frame_count,
+                'frame': self.get_percentiles(self.frame_times),
+                'work': self.get_percentiles(self.work_times),
+                'phases': {phase: self.phase_totals[phase] / frames for phase in self.PHASES},
+                'text_cache': text_cache.stats()}
+
+    def render_overlay(self):
+        """ Render the overlay text on a translucent panel """
+        if self.font is None:
+            self.font = pygame.font.Font(None, 22)
+
+        frame_50, frame_95, frame_99 = self.get_percentiles(self.frame_times)
+        work_50, work_95, work_99 = self.get_percentiles(self.work_times)
+        cache_stats = text_cache.stats()
+        lines = [f'frame ms  p50 {frame_50:5.2f}  p95 {frame_95:5.2f}  p99 {frame_99:5.2f}',
+                 f'work ms   p50 {work_50:5.2f}  p95 {work_95:5.2f}  p99 {work_99:5.2f}',
+                 '  '.join(f'{phase} {self.last_phase_times[phase]:.2f}' for phase in self.PHASES),
+                 f'text cache  hit rate {cache_stats["hit_rate"]:.1%}  hits {cache_stats["hits"]}  '
+                 f'misses {cache_stats["misses"]}  reuses {cache_stats["reuses"]}']
+        texts = [self.font.render(line, True, (255, 255, 0)) for line in lines]
+
+        line_height = self.font.get_linesize()
+        self.overlay = pygame.Surface((max(text.get_width() for text in texts) + 10, line_height * len(texts) + 10),
+                                      pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 180))
+        for i, text in enumerate(texts):
+            self.overlay.blit(text, (5, 5 + i * line_height))
+
+    def draw(self, surface):
+        """ Draw the overlay in the top left corner if it is shown, returns the rects drawn """
+        if not self.is_visible:
+            return []
+        if self.overlay is None:
+            self.render_overlay()
+
+        return [surface.blit(self.overlay, (0, 0))]
+
+    def close(self):
+        """ Flush and close the CSV file """
+        if self.csv_file and not self.csv_file.closed:
+            self.csv_file.close()
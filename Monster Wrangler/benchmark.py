@@ -0,0 +1,127 @@
+import os
+import time
+
+# run without opening a window or an audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import random
+import sys
+import pygame
+from monster import Monster
+from monster_group import MonsterGroup
+from swarm import MonsterSwarm
+
+WINDOW_WIDTH, WINDOW_HEIGHT = 1200, 700
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(
+        os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+def make_round(round_number, image, monster_group):
+    """ Fill a monster group with the monsters of a round, same positions as Game.new_round """
+    for i in range(4 * round_number):
+        monster_group.add(Monster(random.randint(0, WINDOW_WIDTH - 64), random.randint(100, WINDOW_HEIGHT - 264),
+                                  image, i % 4))
+
+
+def benchmark_swarm(monster_counts, frames=60):
+    """ Compare updating monsters one by one against the swarm, with the player collision and drawing """
+    window = pygame.display.get_surface()
+    images = [pygame.image.load(resource_path(f'resources/{colour}_monster.png')).convert_alpha()
+              for colour in ['blue', 'green', 'purple', 'yellow']]
+    player = pygame.sprite.Sprite()
+    player.rect = pygame.Rect(568, 636, 64, 64)
+
+    print(f'Monster simulation per frame over {frames} frames, best drawing of {max(1, frames // 10)} frames')
+    print(f'{"monsters":>9} {"per monster (ms)":>17} {"swarm (ms)":>11} {"group draw (ms)":>16} '
+          f'{"swarm draw (ms)":>16}')
+    for count in monster_counts:
+        monster_groups = [pygame.sprite.Group(), MonsterSwarm()]
+        simulation_times = []
+        for monster_group in monster_groups:
+            random.seed(count)
+            for i in range(count):
+                x = random.randint(0, WINDOW_WIDTH - 64)
+                y = random.randint(100, WINDOW_HEIGHT - 264)
+                monster_group.add(Monster(x, y, images[i % 4], i % 4))
+
+            collide_any = getattr(monster_group, 'collide_any', None)
+            start = time.perf_counter()
+            for frame in range(frames):
+                monster_group.update()
+                if collide_any:
+                    collide_any(player)
+                else:
+                    pygame.sprite.spritecollideany(player, monster_group)
+            simulation_times.append((time.perf_counter() - start) * 1000 / frames)
+
+        # both have to draw the very same monsters
+        group, swarm = monster_groups
+        swarm.sync()
+        assert [monster.rect.topleft for monster in group] == [monster.rect.topleft for monster in swarm.members]
+
+        # the draws take turns and the best of each is kept, so the load of the machine hits both alike
+        draw_times = [float('inf'), float('inf')]
+        for frame in range(max(1, frames // 10)):
+            for i, monster_group in enumerate(monster_groups):
+                start = time.perf_counter()
+                monster_group.draw(window)
+                draw_times[i] = min(draw_times[i], (time.perf_counter() - start) * 1000)
+
+        (group_simulation, swarm_simulation), (group_draw, swarm_draw) = simulation_times, draw_times
+        print(f'{count:>9} {group_simulation:>17.3f} {swarm_simulation:>11.3f} {group_draw:>16.3f} {swarm_draw:>16.3f}')
+
+
+def benchmark_catches(rounds, catches=200):
+    """ Compare picking a target and clearing a round by copying the group against the type buckets """
+    image = pygame.Surface((64, 64))
+
+    print(f'Work on a catch, average of {catches} catches, and clearing a round')
+    print(f'{"round":>6} {"monsters":>9} {"group copy (ms)":>16} {"buckets (ms)":>13} {"one by one (ms)":>16} '
+          f'{"all at once (ms)":>17}')
+    for round_number in rounds:
+        monster_group = MonsterGroup()
+        random.seed(round_number)
+        make_round(round_number, image, monster_group)
+
+        # a new target and whether any monster is left, like a catch in Game.check_collisions
+        start = time.perf_counter()
+        for catch in range(catches):
+            random.choice(monster_group.sprites())
+            pygame.sprite.AbstractGroup.__bool__(monster_group)
+        copied = (time.perf_counter() - start) * 1000 / catches
+
+        start = time.perf_counter()
+        for catch in range(catches):
+            monster_group.random_monster()
+            bool(monster_group)
+        bucketed = (time.perf_counter() - start) * 1000 / catches
+
+        start = time.perf_counter()
+        for monster in monster_group:
+            monster_group.remove(monster)
+        one_by_one = (time.perf_counter() - start) * 1000
+
+        random.seed(round_number)
+        make_round(round_number, image, monster_group)
+        start = time.perf_counter()
+        monster_group.empty()
+        at_once = (time.perf_counter() - start) * 1000
+
+        print(f'{round_number:>6} {4 * round_number:>9} {copied:>16.4f} {bucketed:>13.4f} {one_by_one:>16.3f} {at_once:>17.3f}')
+
+
+if __name__ == '__main__':
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    benchmark_swarm([800, 5000, 10000, 20000])
+    print()
+    benchmark_catches([100, 200, 500, 1000, 2500])
+
+    pygame.quit()
@@ -3,6 +3,7 @@ import pygame
 import sys
 import os
 from monster import Monster
+from text_cache import text_cache, CachedText
 
 
 def resource_path(relative_path):
@@ -15,18 +16,21 @@ def resource_path(relative_path):
 class Game:
     """ A Class to Control Gameplay"""
 
-    def __init__(self, window, player, monster_group, FPS):
-        """ Initialize The Game Object """
+    def __init__(self, window, player, monster_group, FPS, min_monsters=0):
+        """ Initialize The Game Object, every round has at least min_monsters monsters """
         self.score = 0
         self.round = 0
 
         self.timer = 0
         self.frame_count = 0
         self.FPS = FPS
+        # set by pause_game, the main loop clears it
+        self.was_paused = False
 
         self.window = window
         self.player = player
         self.monster_group = monster_group
+        self.min_monsters = min_monsters
 
         self.W_W, self.W_H = self.window.get_size()
 
@@ -34,10 +38,20 @@ class Game:
 
         self.font = pygame.font.Font(resource_path('resources/Abrushow.ttf'), 24)
 
-        blue_img = pygame.image.load(resource_path('resources/blue_monster.png'))
-        green_img = pygame.image.load(resource_path('resources/green_monster.png'))
-        purple_img = pygame.image.load(resource_path('resources/purple_monster.png'))
-        yellow_img = pygame.image.load(resource_path('resources/yellow_monster.png'))
+        # HUD text, rendered again only when its value changes
+        white = (255, 255, 255)
+        self.catch_text = CachedText(self.font, 'Current Catch', True, white)
+        self.score_text = CachedText(self.font, 'Score: {}', True, white)
+        self.lives_text = CachedText(self.font, 'Lives: {}', True, white)
+        self.round_text = CachedText(self.font, 'Round: {}', True, white)
+        self.time_text = CachedText(self.font, 'Round Time: {}', True, white)
+        self.wrap_text = CachedText(self.font, 'Wraps: {}', True, white)
+
+        # converted to the display format once, blitting them is many times faster
+        blue_img = pygame.image.load(resource_path('resources/blue_monster.png')).convert_alpha()
+        green_img = pygame.image.load(resource_path('resources/green_monster.png')).convert_alpha()
+        purple_img = pygame.image.load(resource_path('resources/purple_monster.png')).convert_alpha()
+        yellow_img = pygame.image.load(resource_path('resources/yellow_monster.png')).convert_alpha()
         # monster type
         self.target_imgs = [blue_img, green_img, purple_img, yellow_img]
 
@@ -61,7 +75,6 @@ class Game:
     def draw(self):
         """ Draw The HUD to The Screen"""
         # colours
-        white = (255, 255, 255)
         blue = (20, 176, 235)
         green = (87, 201, 47)
         purple = (226, 73, 243)
@@ -70,28 +83,28 @@ class Game:
         colours = [blue, green, purple, yellow]
 
         # text
-        catch_text = self.font.render('Current Catch', True, white)
+        catch_text = self.catch_text.render()
         catch_rect = catch_text.get_rect()
         catch_rect.centerx = self.W_W // 2
         catch_rect.top = 5
 
-        score_text = self.font.render(f'Score: {self.score}', True, white)
+        score_text = self.score_text.render(self.score)
         score_rect = score_text.get_rect()
         score_rect.topleft = (5, 5)
 
-        lives_text = self.font.render(f'Lives: {self.player.lives}', True, white)
+        lives_text = self.lives_text.render(self.player.lives)
         lives_rect = lives_text.get_rect()
         lives_rect.topleft = (5, 35)
 
-        round_text = self.font.render(f'Round: {self.round}', True, white)
+        round_text = self.round_text.render(self.round)
         round_rect = round_text.get_rect()
         round_rect.topleft = (5, 65)
 
-        time_text = self.font.render(f'Round Time: {self.timer}', True, white)
+        time_text = self.time_text.render(self.timer)
         time_rect = time_text.get_rect()
         time_rect.topright = (self.W_W - 10, 5)
 
-        wrap_text = self.font.render(f'Wraps: {self.player.wraps}', True, white)
+        wrap_text = self.wrap_text.render(self.player.wraps)
         wrap_rect = wrap_text.get_rect()
         wrap_rect.topright = (self.W_W - 10, 35)
 
@@ -109,7 +122,8 @@ class Game:
 
     def check_collisions(self):
         """ Check for Collision Between The Player And The Monsters """
-        collided_monster = pygame.sprite.spritecollideany(self.player, self.monster_group)
+        # a swarm tests the monsters all at once
+        collided_monster = self.monster_group.collide_any(self.player)
 
         if collided_monster:
             if collided_monster.monster_type == self.target_type:
@@ -142,12 +156,11 @@ class Game:
         self.round += 1
         self.player.wraps += 1
 
-        # remove any remaining monster ( loss )
-        for monster in self.monster_group:
-            self.monster_group.remove(monster)
+        # remove any remaining monster ( loss ), all at once
+        self.monster_group.empty()
 
         # new monster
-        for i in range(self.round):
+        for i in range(max(self.round, -(-self.min_monsters // 4))):
             self.monster_group.add(
                 Monster(random.randint(0, self.W_W - 64), random.randint(100, self.W_H - 264), self.target_imgs[0], 0))
             self.monster_group.add(
@@ -162,7 +175,8 @@ class Game:
 
     def set_target(self):
         """ Choose a New Monster Target for The Player """
-        target = random.choice(self.monster_group.sprites())
+        # from the type buckets, without copying the group into a list
+        target = self.monster_group.random_monster()
         self.target_type = target.monster_type
         self.target_img = target.image
 
@@ -171,11 +185,11 @@ class Game:
         white = (255, 255, 255)
         black = (0, 0, 0)
 
-        main_text = self.font.render(main_text, True, white)
+        main_text = text_cache.render(self.font, main_text, True, white)
         main_rect = main_text.get_rect()
         main_rect.center = (self.W_W // 2, self.W_H // 2)
 
-        sub_text = self.font.render(sub_text, True, white)
+        sub_text = text_cache.render(self.font, sub_text, True, white)
         sub_rect = sub_text.get_rect()
         sub_rect.center = (self.W_W // 2, self.W_H // 2 + 64)
 
@@ -195,6 +209,9 @@ class Game:
                 if event.type == pygame.QUIT:
                     sys.exit()
 
+        # the main loop leaves the wait out of the frame times
+        self.was_paused = True
+
     def reset_game(self):
         """ Reset The Game """
         self.score = 0
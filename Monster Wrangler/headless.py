@@ -0,0 +1,245 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+from collections import defaultdict
+
+# no window and no audio device, set before pygame starts
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from game import Game
+from player import Player
+from monster_group import MonsterGroup
+
+WINDOW_WIDTH, WINDOW_HEIGHT = 1200, 700
+FPS = 60
+
+
+class HeadlessGame(Game):
+    """ A game that never waits for the player and logs every round it plays, in an endless game running out of
+    lives only fills them up again, otherwise the game starts again at start_round """
+
+    def __init__(self, *args, start_round=1, is_endless=False):
+        """ Initialize the game """
+        super().__init__(*args)
+        self.start_round = start_round
+        self.is_endless = is_endless
+        self.frames = 0
+        self.game_overs = 0
+        self.is_resetting = False
+
+        # round, monsters at the start, frames and seconds it took, for every round cleared
+        self.round_log = []
+        self.round_start_frame = 0
+        self.round_start_time = time.perf_counter()
+        self.round_monsters = 0
+
+    def update(self):
+        """ Update the game and count the frame """
+        self.frames += 1
+        super().update()
+
+    def new_round(self):
+        """ Log the round just cleared, then start the next one """
+        now = time.perf_counter()
+        if self.round_monsters and not self.is_resetting:
+            self.round_log.append((self.round, self.round_monsters, self.frames - self.round_start_frame,
+                                   now - self.round_start_time))
+
+        # a lost game starts again at the round the run started at, not the first one
+        if self.is_resetting:
+            self.round = self.start_round - 1
+
+        super().new_round()
+        self.round_start_frame = self.frames
+        self.round_start_time = now
+        self.round_monsters = len(self.monster_group)
+
+    def pause_game(self, main_text, sub_text):
+        """ Carry on straight away """
+
+    def reset_game(self):
+        """ Start again from start_round after the player ran out of lives, or carry on if endless """
+        self.game_overs += 1
+        if self.is_endless:
+            self.player.lives = 5
+            return
+
+        self.is_resetting = True
+        super().reset_game()
+        self.is_resetting = False
+
+
+# the moves the agent picks from, x and y direction, standing still first
+MOVES = [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+
+class GreedyAgent:
+    """ Input for the player that heads for the closest monster of the target type without touching the others """
+
+    def __init__(self, margin=6, danger_range=160):
+        """ Initialize the agent, margin covers how far a monster can move in a frame """
+        self.margin = margin
+        self.danger_range = danger_range
+        self.pressed = defaultdict(bool)
+
+    def get_pressed(self):
+        """ Get the keys held down, same as pygame.key.get_pressed """
+        return self.pressed
+
+    def update(self, player, game):
+        """ Choose the keys for the next frame """
+        self.pressed.clear()
+
+        x, y = player.rect.center
+        monsters = game.monster_group.sprites()
+        targets = [(i, monster.rect) for i, monster in enumerate(monsters) if monster.monster_type == game.target_type]
+        if not targets:
+            return
+
+        target_number, target_rect = min(targets, key=lambda target: (target[1].centerx - x) ** 2 +
+                                                                      (target[1].centery - y) ** 2)
+        target_x, target_y = target_rect.center
+        # where the target surely is next frame, wherever it moves
+        target_core = target_rect.inflate(-2 * self.margin, -2 * self.margin)
+
+        # the other monsters close enough to matter this frame, and where they could be next frame
+        danger_rect = player.rect.inflate(2 * self.danger_range, 2 * self.danger_range)
+        dangers = [(i, monster.rect.inflate(2 * self.margin, 2 * self.margin)) for i, monster in enumerate(monsters)
+                   if monster.monster_type != game.target_type and danger_rect.colliderect(monster.rect)]
+        danger_numbers = [i for i, rect in dangers]
+        danger_rects = [rect for i, rect in dangers]
+
+        # of the moves that keep clear of them, take the one ending closest to the target, touching one is fine
+        # while also touching the target added before it, that is the monster the collision check picks
+        best_move = None
+        best_distance = None
+        for dx, dy in MOVES:
+            rect = player.rect.move(dx * player.velocity, dy * player.velocity)
+            touched = rect.collidelistall(danger_rects)
+            if touched and not (rect.colliderect(target_core) and
+                                target_number < min(danger_numbers[j] for j in touched)):
+                continue
+            distance = (rect.centerx - target_x) ** 2 + (rect.centery - target_y) ** 2
+            if best_distance is None or distance < best_distance:
+                best_move = (dx, dy)
+                best_distance = distance
+
+        if best_move is None:
+            # boxed in, escape to the safe zone if a wrap is left
+            if player.wraps > 0:
+                player.wrap()
+            return
+
+        dx, dy = best_move
+        self.pressed[pygame.K_LEFT] = dx < 0
+        self.pressed[pygame.K_RIGHT] = dx > 0
+        self.pressed[pygame.K_UP] = dy < 0
+        self.pressed[pygame.K_DOWN] = dy > 0
+
+
+def get_memory():
+    """ Get the memory in use in KiB, what tracemalloc sees if it is tracing or else the peak resident size, None
+    where the peak resident size is not available """
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0] // 1024
+
+    try:
+        # only on POSIX systems
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB on Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_simulation(seed, rounds, start_round=1, max_frames=None, is_endless=False):
+    """ Play seeded rounds without a window until rounds are cleared, returns the game """
+    random.seed(seed)
+
+    window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    player = Player()
+    agent = GreedyAgent()
+    player.keyboard = agent
+
+    # same groups as main.py
+    player_group = pygame.sprite.Group(player)
+    monster_group = MonsterGroup()
+    game = HeadlessGame(window, player, monster_group, FPS, start_round=start_round, is_endless=is_endless)
+
+    game.round = start_round - 1
+    game.new_round()
+
+    # memory after each round cleared, next to the number of monsters it had
+    game.memory_log = [(0, get_memory())]
+    # time spent choosing the input, it is not part of the game
+    game.agent_time = 0
+    while len(game.round_log) < rounds and (max_frames is None or game.frames < max_frames):
+        rounds_cleared = len(game.round_log)
+
+        # same order as the main game loop, without drawing
+        agent_start = time.perf_counter()
+        agent.update(player, game)
+        game.agent_time += time.perf_counter() - agent_start
+        player_group.update()
+        monster_group.update()
+        game.update()
+
+        if len(game.round_log) > rounds_cleared:
+            game.memory_log.append((game.round_log[-1][1], get_memory()))
+
+    return game
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Play Monster Wrangler rounds without a window and time them')
+    parser.add_argument('--rounds', type=int, default=2000, help='rounds to clear')
+    parser.add_argument('--start-round', type=int, default=1,
+                        help='round to start at, and again after a lost game, later rounds have more monsters')
+    parser.add_argument('--max-frames', type=int, default=None, help='stop after this many frames')
+    parser.add_argument('--endless', action='store_true',
+                        help='never lose the game, so the rounds and the monster group keep growing')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the run')
+    parser.add_argument('--report-every', type=int, default=100, help='rounds between the lines of the report')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='measure the Python heap with tracemalloc instead of the peak resident size, slower')
+    args = parser.parse_args()
+
+    pygame.init()
+    # without the peak resident size, on Windows, the heap is traced instead
+    if args.trace_memory or get_memory() is None:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    game = run_simulation(args.seed, args.rounds, args.start_round, args.max_frames, args.endless)
+    elapsed = time.perf_counter() - start
+
+    memory_unit = 'heap KiB' if tracemalloc.is_tracing() else 'peak RSS KiB'
+    print(f'{"cleared":>8} {"round":>6} {"monsters":>9} {"frames":>7} {"ms":>8} {"frames/s":>9} {memory_unit:>13}')
+    for i, (round_number, monsters, frames, seconds) in enumerate(game.round_log):
+        if (i + 1) % args.report_every == 0 or i == 0 or i == len(game.round_log) - 1:
+            print(f'{i + 1:>8} {round_number:>6} {monsters:>9} {frames:>7} {seconds * 1000:>8.1f} '
+                  f'{frames / max(seconds, 1e-9):>9.0f} {game.memory_log[i + 1][1]:>13}')
+
+    round_frames = [frames for round_number, monsters, frames, seconds in game.round_log]
+    first_memory = game.memory_log[0][1]
+    last_memory = game.memory_log[-1][1]
+    print(f'{len(game.round_log)} rounds cleared and {game.game_overs} games lost in {game.frames} frames, '
+          f'{elapsed:.1f} s')
+    simulation_time = elapsed - game.agent_time
+    print(f'Throughput: {game.frames / simulation_time:.0f} simulated frames per second without the agent, '
+          f'{game.frames / elapsed:.0f} with it, {game.frames / FPS / elapsed:.0f} times real time')
+    if round_frames:
+        print(f'Round length: {sum(round_frames) / len(round_frames):.0f} frames on average, '
+              f'longest {max(round_frames)}')
+    largest_round = max(monsters for round_number, monsters, frames, seconds in game.round_log) if game.round_log else 0
+    print(f'Memory: {first_memory} KiB at the start, {last_memory} KiB at the end '
+          f'({last_memory - first_memory:+} KiB), the largest round had {largest_round} monsters')
+
+    pygame.quit()
@@ -6,6 +6,9 @@ import sys
 from game import Game
 from player import Player
 from monster import Monster
+from monster_group import MonsterGroup
+from swarm import MonsterSwarm
+from profiler import FrameProfiler, get_csv_path
 
 
 def resource_path(relative_path):
@@ -32,18 +35,30 @@ player_group = pygame.sprite.Group()
 player = Player()
 player_group.add(player)
 
-# create a monster group
-monster_group = pygame.sprite.Group()
+# with '--stress' every round has thousands of monsters and the frame time is printed against their count
+STRESS_MONSTERS = 10000 if '--stress' in sys.argv else 0
+frame_times = []
+
+# create a monster group, a swarm moved all at once when stressed
+if STRESS_MONSTERS:
+    monster_group = MonsterSwarm()
+else:
+    monster_group = MonsterGroup()
 
 # create a game object
-game = Game(window, player, monster_group, FPS)
+game = Game(window, player, monster_group, FPS, STRESS_MONSTERS)
 game.pause_game("Monster Wrangler", "Press 'Enter' to Start")
 game.new_round()
 
+# F3 shows frame times, '--profile-csv <file>' saves them
+profiler = FrameProfiler(get_csv_path())
+
 # main game loop
 running = True
 while running:
+    profiler.start_frame()
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
 
@@ -51,24 +66,51 @@ while running:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 player.wrap()
+    profiler.mark('events')
+
+    # update sprite groups
+    player_group.update()
+    monster_group.update()
+    profiler.mark('update')
+
+    # update the game
+    game.update()
+    profiler.mark('collision')
+
+    # a pause waited for the player inside the update, time the frame from here
+    if game.was_paused:
+        game.was_paused = False
+        profiler.start_frame()
 
     # fill the display
     window.fill((0, 0, 0))
 
-    # update and draw sprite groups
-    player_group.update()
+    # draw sprite groups
     player_group.draw(window)
-
-    monster_group.update()
     monster_group.draw(window)
 
-    # update and draw the game
-    game.update()
+    # draw the game and the profiler overlay
     game.draw()
+    profiler.draw(window)
+    profiler.mark('draw')
 
     # update display and tick the clock
     pygame.display.update()
+    profiler.mark('flip')
+
+    if STRESS_MONSTERS:
+        # moving and colliding the monsters, and the whole work of the frame without the wait for the next one
+        phase_times = profiler.phase_times
+        frame_times.append((phase_times['update'] + phase_times['collision'],
+                            sum(phase_times.values()) - phase_times['wait']))
+        if len(frame_times) == FPS:
+            simulation_time, work_time = (sum(times) / FPS for times in zip(*frame_times))
+            print(f'{len(monster_group)} monsters: {simulation_time:.2f} ms simulation, {work_time:.2f} ms a frame')
+            frame_times.clear()
     clock.tick(FPS)
+    profiler.mark('wait')
+    profiler.end_frame()
 
 # quit pygame
+profiler.close()
 pygame.quit()
@@ -1,6 +1,10 @@
 import random
 import pygame
 
+# the top left corner of a monster bounces back once it is past these
+MIN_X, MAX_X = 0, 1136
+MIN_Y, MAX_Y = 100, 536
+
 
 class Monster(pygame.sprite.Sprite):
     """ A Class to Create an Enemy Monster """
@@ -24,8 +28,8 @@ class Monster(pygame.sprite.Sprite):
         self.rect.y += self.dy * self.velocity
 
         # bounce
-        if self.rect.y > 536 or self.rect.y < 100:
+        if self.rect.y > MAX_Y or self.rect.y < MIN_Y:
             self.dy *= -1
-        if self.rect.x > 1136 or self.rect.x < 0:
+        if self.rect.x > MAX_X or self.rect.x < MIN_X:
             self.dx *= -1
 
@@ -0,0 +1,58 @@
+import random
+import pygame
+
+
+class MonsterGroup(pygame.sprite.Group):
+    """ A sprite group that also keeps a bucket of monsters for every monster type, for picking targets quickly """
+
+    def __init__(self, *sprites):
+        """ Initialize the group """
+        # monster type -> list of monsters of that type, in no particular order
+        self.buckets = {}
+
+        super().__init__(*sprites)
+
+    def __len__(self):
+        """ The number of monsters, without copying the group into a list """
+        return len(self.spritedict)
+
+    def __bool__(self):
+        """ Whether any monster is left, without copying the group into a list """
+        return bool(self.spritedict)
+
+    def add_internal(self, sprite, layer=None):
+        """ Add a monster and put it at the end of the bucket of its type """
+        super().add_internal(sprite, layer)
+        bucket = self.buckets.setdefault(sprite.monster_type, [])
+        sprite.bucket_index = len(bucket)
+        bucket.append(sprite)
+
+    def remove_internal(self, sprite):
+        """ Remove a monster, the last monster of its bucket takes its place """
+        super().remove_internal(sprite)
+        bucket = self.buckets[sprite.monster_type]
+        last = bucket.pop()
+        if last is not sprite:
+            bucket[sprite.bucket_index] = last
+            last.bucket_index = sprite.bucket_index
+
+    def empty(self):
+        """ Remove every monster at once """
+        for sprite in self.spritedict:
+            sprite.remove_internal(self)
+
+        self.spritedict.clear()
+        self.lostsprites = []
+        self.buckets = {}
+
+    def collide_any(self, sprite):
+        """ Get a monster the sprite touches or None, same as pygame.sprite.spritecollideany """
+        return pygame.sprite.spritecollideany(sprite, self)
+
+    def random_monster(self):
+        """ Pick a monster at random, every monster is as likely as with random.choice on the whole group """
+        number = random.randrange(len(self.spritedict))
+        for bucket in self.buckets.values():
+            if number < len(bucket):
+                return bucket[number]
+            number -= len(bucket)
@@ -24,13 +24,16 @@ class Player(pygame.sprite.Sprite):
         self.wraps = 2
         self.velocity = 8
 
+        # where the held keys are read from, a headless agent can replace it
+        self.keyboard = pygame.key
+
         self.catch_sound = pygame.mixer.Sound(resource_path('resources/catch.wav'))
         self.die_sound = pygame.mixer.Sound(resource_path('resources/die.wav'))
         self.wrap_sound = pygame.mixer.Sound(resource_path('resources/warp.wav'))
 
     def update(self):
         """ Update the Player """
-        keys = pygame.key.get_pressed()
+        keys = self.keyboard.get_pressed()
 
         if (keys[pygame.K_a] or keys[pygame.K_LEFT]) and self.rect.x > 0:
             self.rect.x -= self.velocity
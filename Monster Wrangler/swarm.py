@@ -0,0 +1,152 @@
+import numpy as np
+from monster_group import MonsterGroup
+from monster import MIN_X, MAX_X, MIN_Y, MAX_Y
+
+
+class MonsterSwarm(MonsterGroup):
+    """ A monster group moving every monster in one step, their positions, directions and speeds kept in arrays
+
+    While in the swarm a monster is only a view for the game, its image and type are used but its own update is
+    not, and its rect is only brought up to date when it is hit, removed or the swarm is synced """
+
+    def __init__(self, *sprites, capacity=64):
+        """ Initialize the swarm """
+        # top left corner, x and y direction, speed and size of each monster, the first count rows are in use
+        self.positions = np.zeros((capacity, 2), dtype=np.int64)
+        self.directions = np.zeros((capacity, 2), dtype=np.int64)
+        self.velocities = np.zeros(capacity, dtype=np.int64)
+        self.sizes = np.zeros((capacity, 2), dtype=np.int64)
+        self.count = 0
+
+        # the monsters and their images in the order of the array rows, which is the order they were added in
+        self.members = []
+        self.images = []
+
+        # rows of removed monsters, packed away before the arrays are used again
+        self.removed_rows = []
+
+        super().__init__(*sprites)
+
+    def grow(self, capacity):
+        """ Make room for capacity monsters """
+        for name in ['positions', 'directions', 'velocities', 'sizes']:
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            setattr(self, name, grown)
+
+    def add_internal(self, sprite, layer=None):
+        """ Add a monster, where it is and how it moves are copied to the arrays """
+        super().add_internal(sprite, layer)
+        if self.count == len(self.positions):
+            self.grow(2 * self.count)
+
+        row = self.count
+        self.positions[row] = sprite.rect.topleft
+        self.directions[row] = (sprite.dx, sprite.dy)
+        self.velocities[row] = sprite.velocity
+        self.sizes[row] = sprite.rect.size
+        self.count += 1
+
+        sprite.swarm_row = row
+        self.members.append(sprite)
+        self.images.append(sprite.image)
+
+    def remove_internal(self, sprite):
+        """ Remove a monster, its rect and movement are written back to it """
+        super().remove_internal(sprite)
+        # rows only move when the arrays are packed, so the row of the monster is still its own
+        self.sync_sprite(sprite)
+        self.removed_rows.append(sprite.swarm_row)
+
+    def empty(self):
+        """ Remove every monster at once, the arrays are emptied without writing anything back """
+        self.count = 0
+        self.members = []
+        self.images = []
+        self.removed_rows = []
+
+        super().empty()
+
+    def pack(self):
+        """ Drop the rows of removed monsters, keeping the others in order """
+        if not self.removed_rows:
+            return
+
+        if len(self.removed_rows) == self.count:
+            # a new round removes every monster at once
+            self.count = 0
+            self.members = []
+            self.images = []
+        else:
+            is_kept = np.ones(self.count, dtype=bool)
+            is_kept[self.removed_rows] = False
+            count = int(np.count_nonzero(is_kept))
+            for name in ['positions', 'directions', 'velocities', 'sizes']:
+                array = getattr(self, name)
+                array[:count] = array[:self.count][is_kept]
+
+            self.count = count
+            self.members = [sprite for sprite, kept in zip(self.members, is_kept.tolist()) if kept]
+            self.images = [sprite.image for sprite in self.members]
+            for row, sprite in enumerate(self.members):
+                sprite.swarm_row = row
+
+        self.removed_rows = []
+
+    def sync_sprite(self, sprite):
+        """ Write the position and movement of a monster from the arrays to the sprite """
+        row = sprite.swarm_row
+        sprite.rect.topleft = self.positions[row].tolist()
+        sprite.dx, sprite.dy = self.directions[row].tolist()
+
+    def sync(self):
+        """ Write the position and movement of every monster back to its sprite """
+        self.pack()
+        for sprite in self.members:
+            self.sync_sprite(sprite)
+
+    def update(self, *args, **kwargs):
+        """ Move every monster and bounce the ones past the edges, same rules as Monster.update """
+        self.pack()
+        positions = self.positions[:self.count]
+        directions = self.directions[:self.count]
+
+        positions += directions * self.velocities[:self.count, np.newaxis]
+
+        # bounce
+        directions[(positions[:, 0] > MAX_X) | (positions[:, 0] < MIN_X), 0] *= -1
+        directions[(positions[:, 1] > MAX_Y) | (positions[:, 1] < MIN_Y), 1] *= -1
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        """ Draw every monster straight from the arrays with one call, fblits where pygame has it """
+        self.pack()
+        positions = self.positions[:self.count]
+        # a list per monster would be kept alive until the end and set off the garbage collector, zip instead hands
+        # blits the same pair again once it is done with it
+        blit_sequence = zip(self.images, zip(positions[:, 0].tolist(), positions[:, 1].tolist()))
+        if hasattr(surface, 'fblits'):
+            surface.fblits(blit_sequence)
+        else:
+            surface.blits(blit_sequence, False)
+        self.lostsprites = []
+
+        return self.lostsprites
+
+    def collide_any(self, sprite):
+        """ Same as pygame.sprite.spritecollideany, the monsters are tested all at once """
+        self.pack()
+        rect = sprite.rect
+        positions = self.positions[:self.count]
+        ends = positions + self.sizes[:self.count]
+
+        # same rule as Rect.colliderect, the first monster added wins
+        hits = np.flatnonzero((positions[:, 0] < rect.right) & (ends[:, 0] > rect.left) &
+                              (positions[:, 1] < rect.bottom) & (ends[:, 1] > rect.top))
+        if not len(hits):
+            return None
+
+        collided = self.members[hits[0]]
+        self.sync_sprite(collided)
+
+        return collided
@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+import random
+
+# run without opening a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from body import SnakeBody
+from board import SnakeBoard
+
+CELL_SIZE = 32
+COLUMNS = ROWS = 20
+RED = (232, 48, 48)
+YELLOW = (232, 223, 48)
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(
+        os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+def get_winding_path():
+    """ Get the top left corner of every cell, row by row and every other row backwards """
+    path = []
+    for row in range(ROWS):
+        columns = range(COLUMNS) if row % 2 == 0 else reversed(range(COLUMNS))
+        path.extend((column * CELL_SIZE, row * CELL_SIZE) for column in columns)
+
+    return path
+
+
+def make_snake(length):
+    """ Make a snake of length segments winding row by row over the board, the head is the next cell on """
+    body = SnakeBody(COLUMNS, ROWS, CELL_SIZE)
+    path = get_winding_path()
+
+    for x, y in path[:length]:
+        body.append(x, y)
+
+    # where the head is when the food is eaten, off the board once the snake fills it
+    head = path[length] if length < len(path) else (-CELL_SIZE, -CELL_SIZE)
+    return body, head
+
+
+def place_by_retrying(body, head, max_tries):
+    """ Draw random cells until one is free, like food was placed before the free cell index, returns the tries """
+    food_pos = [x for x in range(0, COLUMNS * CELL_SIZE, CELL_SIZE)]
+    for tries in range(1, max_tries + 1):
+        position = random.choice(food_pos), random.choice(food_pos)
+        if not body.is_occupied(*position) and position != head:
+            return tries
+
+    return None
+
+
+def benchmark_food_placement(lengths, placements=2000, max_tries=100000):
+    """ Compare placing food by retrying random cells against sampling the free cell index as the board fills up """
+    print(f'Food placement, average of {placements} placements')
+    print(f'{"snake":>6} {"free cells":>11} {"retrying (ms)":>14} {"tries":>9} {"free cell index (ms)":>21}')
+    for length in lengths:
+        body, head = make_snake(length)
+        free_count = COLUMNS * ROWS - length - (length < COLUMNS * ROWS)
+
+        random.seed(length)
+        tries = []
+        start = time.perf_counter()
+        for placement in range(placements):
+            tries.append(place_by_retrying(body, head, max_tries))
+            if tries[-1] is None:
+                break
+        retrying = (time.perf_counter() - start) * 1000 / len(tries)
+
+        start = time.perf_counter()
+        positions = [body.random_free_cell(head) for placement in range(placements)]
+        sampled = (time.perf_counter() - start) * 1000 / placements
+
+        # every cell picked is free and not the head, and every free cell gets picked
+        if free_count:
+            assert not any(body.is_occupied(*position) or position == head for position in positions)
+            assert len(set(positions)) == free_count or placements < 10 * free_count
+        else:
+            assert positions == [None] * placements
+
+        if None in tries:
+            retry_text = f'{"never":>14} {f">{max_tries}":>9}'
+        else:
+            retry_text = f'{retrying:>14.4f} {sum(tries) / len(tries):>9.1f}'
+        print(f'{length:>6} {free_count:>11} {retry_text} {sampled:>21.4f}')
+
+
+def benchmark_rendering(lengths, ticks=200):
+    """ Compare painting the whole board every tick against painting only the cells that changed """
+    window = pygame.display.get_surface()
+    bg_img = pygame.image.load(resource_path('resources/bg_img.jpg')).convert()
+    food_img = pygame.image.load(resource_path('resources/apple.png')).convert_alpha()
+    food_rect = food_img.get_rect()
+    path = get_winding_path()
+
+    print(f'Rendering a tick of a moving snake, average of {ticks} ticks')
+    print(f'{"snake":>6} {"whole board (ms)":>17} {"changed cells (ms)":>19} {"cells sent":>11}')
+    for length in lengths:
+        # the snake goes round the winding path, the food stays in the corner
+        body = SnakeBody(COLUMNS, ROWS, CELL_SIZE)
+        for x, y in path[:length]:
+            body.append(x, y)
+        board = SnakeBoard(bg_img, food_img, RED, YELLOW, CELL_SIZE)
+        board.redraw(body, food_rect)
+
+        start = time.perf_counter()
+        for tick in range(ticks):
+            window.blit(bg_img, (0, 0))
+            window.blit(food_img, food_rect)
+            for i, (x, y) in enumerate(body):
+                pygame.draw.rect(window, RED if i == 0 else YELLOW, (x, y, CELL_SIZE, CELL_SIZE))
+            pygame.display.update()
+        whole_board = (time.perf_counter() - start) * 1000 / ticks
+
+        dirty_count = 0
+        start = time.perf_counter()
+        for tick in range(ticks):
+            body.trim(length - 1)
+            body.append(*path[(length + tick) % len(path)])
+            dirty_rects = board.update(body, food_rect)
+            for rect in dirty_rects:
+                window.blit(board.surface, rect, rect)
+            pygame.display.update(dirty_rects)
+            dirty_count += len(dirty_rects)
+        changed_cells = (time.perf_counter() - start) * 1000 / ticks
+
+        print(f'{length:>6} {whole_board:>17.4f} {changed_cells:>19.4f} {dirty_count / ticks:>11.1f}')
+
+
+if __name__ == '__main__':
+    pygame.init()
+    pygame.display.set_mode((COLUMNS * CELL_SIZE, ROWS * CELL_SIZE))
+
+    benchmark_food_placement([0, 200, 360, 396, 398, 399, 400])
+    print()
+    benchmark_rendering([1, 10, 100, 300, 399])
+
+    pygame.quit()
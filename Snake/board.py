@@ -0,0 +1,78 @@
+import pygame
+
+
+class SnakeBoard:
+    """ A persistent picture of the board, only the cells that changed since the last tick are painted again """
+
+    def __init__(self, background, food_img, head_colour, body_colour, cell_size):
+        """ Initialize the board """
+        self.background = background
+        self.food_img = food_img
+        self.head_colour = head_colour
+        self.body_colour = body_colour
+        self.cell_size = cell_size
+
+        self.surface = background.copy()
+        # where the food was painted
+        self.food_topleft = None
+
+    def get_cell_rect(self, column, row):
+        """ Get the rect of a cell in pixels """
+        return pygame.Rect(column * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size)
+
+    def paint_background(self, rect):
+        """ Paint a cell with the background """
+        self.surface.blit(self.background, rect, rect)
+
+    def paint_segment(self, body, column, row, is_head):
+        """ Paint a cell of the snake, the head is only on top while no other segment is on its cell """
+        is_head = is_head and body.occupancy[row * body.columns + column] == 1
+        self.surface.fill(self.head_colour if is_head else self.body_colour, self.get_cell_rect(column, row))
+
+    def redraw(self, body, food_rect):
+        """ Paint the whole board, returns its rect """
+        self.surface.blit(self.background, (0, 0))
+        self.surface.blit(self.food_img, food_rect)
+        self.food_topleft = food_rect.topleft
+
+        # the tail first, so the head ends up on top
+        for i, (column, row) in enumerate(body.cells):
+            self.paint_segment(body, column, row, i == len(body) - 1)
+
+        body.vacated_cells.clear()
+        return self.surface.get_rect()
+
+    def update(self, body, food_rect):
+        """ Paint the cells that changed since the last tick, returns their rects """
+        dirty_rects = []
+
+        # the cells the tail left
+        for column, row in body.vacated_cells:
+            if not body.occupancy[row * body.columns + column]:
+                rect = self.get_cell_rect(column, row)
+                self.paint_background(rect)
+                dirty_rects.append(rect)
+        body.vacated_cells.clear()
+
+        # food that moved, where it was is under the head now
+        if food_rect.topleft != self.food_topleft:
+            if self.food_topleft is not None:
+                rect = pygame.Rect(self.food_topleft, food_rect.size)
+                self.paint_background(rect)
+                dirty_rects.append(rect)
+            self.paint_background(food_rect)
+            self.surface.blit(self.food_img, food_rect)
+            dirty_rects.append(food_rect.copy())
+            self.food_topleft = food_rect.topleft
+
+        # the old head turns into body, then the new head
+        if len(body) > 1:
+            column, row = body.cells[-2]
+            self.paint_segment(body, column, row, False)
+            dirty_rects.append(self.get_cell_rect(column, row))
+        if len(body):
+            column, row = body.cells[-1]
+            self.paint_segment(body, column, row, True)
+            dirty_rects.append(self.get_cell_rect(column, row))
+
+        return dirty_rects
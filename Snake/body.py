@@ -0,0 +1,114 @@
+import random
+from collections import deque
+
+
+class SnakeBody:
+    """ The cells of the snake, newest first, in a bounded ring buffer with an occupancy bitmap of the board and
+    an index of the free cells """
+
+    def __init__(self, columns, rows, cell_size):
+        """ Initialize an empty body on a board of columns x rows cells """
+        self.columns = columns
+        self.rows = rows
+        self.cell_size = cell_size
+
+        # the snake can never be longer than the board, so the buffer never grows past it
+        self.cells = deque(maxlen=columns * rows)
+
+        # how many segments are on each cell, row by row
+        self.occupancy = bytearray(columns * rows)
+
+        # the cells without a segment in no particular order, and where each cell is in that list
+        self.free_cells = list(range(columns * rows))
+        self.free_positions = list(range(columns * rows))
+
+        # cells the tail left since the board was last painted
+        self.vacated_cells = []
+
+    def __len__(self):
+        """ The number of segments """
+        return len(self.cells)
+
+    def __iter__(self):
+        """ The top left corner of each segment in pixels, head first """
+        cell_size = self.cell_size
+        for column, row in reversed(self.cells):
+            yield column * cell_size, row * cell_size
+
+    def get_cell(self, x, y):
+        """ Get the column and row of a position in pixels """
+        return x // self.cell_size, y // self.cell_size
+
+    def is_occupied(self, x, y):
+        """ Check if a segment is on the cell of a position in pixels """
+        column, row = self.get_cell(x, y)
+        return self.occupancy[row * self.columns + column] > 0
+
+    def append(self, x, y):
+        """ Add a new head at a position in pixels """
+        if len(self.cells) == self.cells.maxlen:
+            self.pop_tail()
+
+        column, row = self.get_cell(x, y)
+        self.cells.append((column, row))
+        self.occupy(row * self.columns + column)
+
+    def pop_tail(self):
+        """ Remove the last segment """
+        column, row = self.cells.popleft()
+        self.release(row * self.columns + column)
+        self.vacated_cells.append((column, row))
+
+    def occupy(self, cell):
+        """ Count a segment on a cell, taking it out of the free cells if it was free """
+        if not self.occupancy[cell]:
+            # the last free cell takes its place
+            position = self.free_positions[cell]
+            last = self.free_cells.pop()
+            if last != cell:
+                self.free_cells[position] = last
+                self.free_positions[last] = position
+
+        self.occupancy[cell] += 1
+
+    def release(self, cell):
+        """ Take a segment off a cell, it goes back to the free cells once none are left on it """
+        self.occupancy[cell] -= 1
+        if not self.occupancy[cell]:
+            self.free_positions[cell] = len(self.free_cells)
+            self.free_cells.append(cell)
+
+    def random_free_cell(self, exclude=None):
+        """ Pick a free cell at random and get its top left corner in pixels, exclude is a position in pixels that
+        is not picked either, returns None when no cell is left """
+        free_count = len(self.free_cells)
+        if exclude is not None:
+            column, row = self.get_cell(*exclude)
+            excluded = row * self.columns + column
+            if 0 <= column < self.columns and 0 <= row < self.rows and not self.occupancy[excluded]:
+                # swap the excluded cell to the end of the free cells and pick from the others
+                position = self.free_positions[excluded]
+                last = self.free_cells[-1]
+                self.free_cells[position], self.free_cells[-1] = last, excluded
+                self.free_positions[last], self.free_positions[excluded] = position, free_count - 1
+                free_count -= 1
+
+        if not free_count:
+            return None
+
+        cell = self.free_cells[random.randrange(free_count)]
+        row, column = divmod(cell, self.columns)
+        return column * self.cell_size, row * self.cell_size
+
+    def trim(self, length):
+        """ Remove segments from the tail until the body is at most length long """
+        while len(self.cells) > length:
+            self.pop_tail()
+
+    def clear(self):
+        """ Remove every segment """
+        self.cells.clear()
+        self.occupancy = bytearray(self.columns * self.rows)
+        self.free_cells = list(range(self.columns * self.rows))
+        self.free_positions = list(range(self.columns * self.rows))
+        self.vacated_cells = []
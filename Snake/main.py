@@ -1,7 +1,10 @@
-from random import choice
 import pygame
 import sys
 import os
+from text_cache import CachedText
+from body import SnakeBody
+from board import SnakeBoard
+from profiler import FrameProfiler, get_csv_path
 
 
 def resource_path(relative_path):
@@ -19,6 +22,11 @@ WINDOW_WIDTH = 640
 WINDOW_HEIGHT = 640
 window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 
+# the board is a grid of 32 pixel cells
+CELL_SIZE = 32
+COLUMNS = WINDOW_WIDTH // CELL_SIZE
+ROWS = WINDOW_HEIGHT // CELL_SIZE
+
 # set FPS and Clock
 FPS = 9
 clock = pygame.time.Clock()
@@ -30,14 +38,14 @@ YELLOW = (232, 223, 48)  # body
 GREEN = (65, 232, 48)
 BLACK = (0, 0, 0)
 
-# poisitions for food
-food_pos = [x for x in range(0, 640, 32)]
-
 # fonts
 font = pygame.font.Font(resource_path('resources/GamePlayed.ttf'), 32)
 
+# score text, rendered again only when the score changes
+score_hud = CachedText(font, 'Your Score is: {}', True, BLACK, GREEN)
+
 # text
-score_text = font.render(f'Your Score is: 0', True, BLACK, GREEN)
+score_text = score_hud.render(0)
 score_rect = score_text.get_rect()
 score_rect.center = (WINDOW_WIDTH//2, WINDOW_HEIGHT//2)
 
@@ -50,30 +58,35 @@ continue_rect = continue_text.get_rect()
 continue_rect.center = (WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 36)
 
 # load images
-bg_img = pygame.image.load(resource_path('resources/bg_img.jpg'))
+bg_img = pygame.image.load(resource_path('resources/bg_img.jpg')).convert()
 bg_rect = bg_img.get_rect()
 bg_rect.topleft = (0, 0)
 
-food_img = pygame.image.load(resource_path('resources/apple.png'))
+food_img = pygame.image.load(resource_path('resources/apple.png')).convert_alpha()
 food_rect = food_img.get_rect()
-random_pos_x, random_pos_y = choice(food_pos), choice(food_pos)
-food_rect.topleft = (random_pos_x, random_pos_y)
 
 
 # CONSTANTS
 STARTING_SCORE = 0
 STARTING_HEAD_X = WINDOW_WIDTH//2
 STARTING_HEAD_Y = WINDOW_HEIGHT//2
-STARTING_POISTIONS_X = []
-STARTING_POISTIONS_y = []
 
 score = STARTING_SCORE
 head_x = STARTING_HEAD_X
 head_y = STARTING_HEAD_Y
 move_x = 1
 move_y = 0
-poistions_x = STARTING_POISTIONS_X
-poistions_y = STARTING_POISTIONS_y
+
+# the cells the snake is on, never longer than the board
+body = SnakeBody(COLUMNS, ROWS, CELL_SIZE)
+
+# food goes on a random free cell, never under the head
+food_rect.topleft = body.random_free_cell((head_x, head_y))
+
+# the board is kept between ticks and only the cells that changed are painted and sent to the display
+board = SnakeBoard(bg_img, food_img, RED, YELLOW, CELL_SIZE)
+is_redraw_needed = True
+overlay_rects = []
 
 # load sounds
 eat_sound = pygame.mixer.Sound(resource_path('resources/eat_sound.wav'))
@@ -81,11 +94,17 @@ pygame.mixer.music.load(resource_path('resources/bg_music.wav'))
 pygame.mixer.music.play(-1, 0.0)
 
 
+# F3 shows frame times, '--profile-csv <file>' saves them
+profiler = FrameProfiler(get_csv_path())
+
 # game main loop
 result = False
 running = True
 while running:
+    profiler.start_frame()
+    dirty_rects = []
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.KEYDOWN:
@@ -107,63 +126,89 @@ while running:
             head_y = STARTING_HEAD_Y
             move_x = 1
             move_y = 0
-            poistions_x = STARTING_POISTIONS_X
-            poistions_y = STARTING_POISTIONS_y
-            random_pos_x, random_pos_y = choice(food_pos), choice(food_pos)
-            food_rect.topleft = (random_pos_x, random_pos_y)
+            body.clear()
+            food_rect.topleft = body.random_free_cell((head_x, head_y))
+            is_redraw_needed = True
             pygame.mixer.music.play(-1, 0.0)
             result = False
-
-    # filling background
-    window.blit(bg_img, bg_rect)
-
-    # blitting food
-    window.blit(food_img, food_rect)
+    profiler.mark('events')
 
     # if game is over
     if result:
-        score_text = font.render(f'Your Score is: {score}', True, BLACK, GREEN)
+        # filling background
+        window.blit(bg_img, bg_rect)
+
+        # blitting food
+        window.blit(food_img, food_rect)
+
+        score_text = score_hud.render(score)
         window.blit(score_text, score_rect)
         window.blit(game_over_text, game_over_rect)
         window.blit(continue_text, continue_rect)
+        dirty_rects.append(window.get_rect())
+    profiler.mark('draw')
 
     # check if ate food
     if food_rect.collidepoint(head_x, head_y):
         eat_sound.play()
         score += 1
-        random_pos_x, random_pos_y = choice(food_pos), choice(food_pos)
-        food_rect.topleft = (random_pos_x, random_pos_y)
-        while(random_pos_x in r_x[:score+1]):
-            random_pos_x, random_pos_y = choice(food_pos), choice(food_pos)
-            food_rect.topleft = (random_pos_x, random_pos_y)
+        # not on the snake, the head included, in the same time however full the board is
+        food_position = body.random_free_cell((head_x, head_y))
+        if food_position is not None:
+            food_rect.topleft = food_position
+        else:
+            # the snake fills the board, nothing is left to eat
+            result = True
+            pygame.mixer.music.stop()
 
     # check if hit the edges
-    if head_x < 0 or head_x > WINDOW_WIDTH or head_y < 0 or head_y > WINDOW_HEIGHT:
+    if head_x < 0 or head_x >= WINDOW_WIDTH or head_y < 0 or head_y >= WINDOW_HEIGHT:
         result = True
         pygame.mixer.music.stop()
+    profiler.mark('collision')
 
+    # moves and checks the body
     if not result:
+        # keep the score segments behind the head, the tail only stays when food was eaten
+        body.trim(score)
+
+        # check if head hits body
+        if body.is_occupied(head_x, head_y):
+            pygame.mixer.music.stop()
+            result = True
+
         # saving positions
-        poistions_x.append(head_x)
-        poistions_y.append(head_y)
-        # get reversed lists
-        r_x = list(reversed(poistions_x))
-        r_y = list(reversed(poistions_y))
+        body.append(head_x, head_y)
 
         # moving the snake
         head_x += 32 * move_x
         head_y += 32 * move_y
-        for i in range(score+1):
-            pygame.draw.rect(window, RED if i == 0 else YELLOW,
-                             (r_x[i], r_y[i], 32, 32))
-            # check if head hits body
-            if i:
-                if r_x[0] == r_x[i] and r_y[0] == r_y[i]:
-                    pygame.mixer.music.stop()
-                    result = True
-
-    # update window and tick the clock
-    pygame.display.update()
+    profiler.mark('update')
+
+    if body.cells and not dirty_rects:
+        # paint the new head, the old head and the cell the tail left, or everything after a new game
+        if is_redraw_needed:
+            board_rects = [board.redraw(body, food_rect)]
+            is_redraw_needed = False
+        else:
+            board_rects = board.update(body, food_rect)
+
+        # the overlay of the last frame is painted over too
+        for rect in board_rects + overlay_rects:
+            window.blit(board.surface, rect, rect)
+        dirty_rects += board_rects + overlay_rects
+
+    # draw the profiler overlay
+    overlay_rects = profiler.draw(window)
+    dirty_rects += overlay_rects
+    profiler.mark('draw')
+
+    # update the cells that changed and tick the clock
+    pygame.display.update(dirty_rects)
+    profiler.mark('flip')
     clock.tick(FPS)
+    profiler.mark('wait')
+    profiler.end_frame()
 
+profiler.close()
 pygame.quit()
@@ -0,0 +1,83 @@
+import pygame
+import os
+import sys
+import time
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(
+        os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+class AssetRegistry:
+    """ Loads every image, sound and font in resources once and hands out the shared objects """
+
+    def __init__(self):
+        """ Initialize the registry """
+        # file name (and size for fonts) -> loaded asset
+        self.images = {}
+        self.sounds = {}
+        self.fonts = {}
+
+        self.loads = 0
+        self.hits = 0
+        self.load_time = 0
+
+    def image(self, name):
+        """ Get the shared image, converted to the display format the first time it is loaded """
+        if name in self.images:
+            self.hits += 1
+            return self.images[name]
+
+        start = time.perf_counter()
+        image = pygame.image.load(resource_path(f'resources/{name}'))
+        # converting needs a display, without one the image is kept as loaded
+        if pygame.display.get_surface():
+            image = image.convert_alpha()
+        self.images[name] = image
+        self.count_load(start)
+
+        return image
+
+    def sound(self, name):
+        """ Get the shared, decoded sound """
+        if name in self.sounds:
+            self.hits += 1
+            return self.sounds[name]
+
+        start = time.perf_counter()
+        sound = pygame.mixer.Sound(resource_path(f'resources/{name}'))
+        self.sounds[name] = sound
+        self.count_load(start)
+
+        return sound
+
+    def font(self, name, size):
+        """ Get the shared font of a size """
+        key = (name, size)
+        if key in self.fonts:
+            self.hits += 1
+            return self.fonts[key]
+
+        start = time.perf_counter()
+        font = pygame.font.Font(resource_path(f'resources/{name}'), size)
+        self.fonts[key] = font
+        self.count_load(start)
+
+        return font
+
+    def count_load(self, start):
+        """ Count a load from disk that started at start """
+        self.loads += 1
+        self.load_time += time.perf_counter() - start
+
+    def stats(self):
+        """ Report how many assets were loaded from disk, served from the registry and the time spent loading """
+        return {'loads': self.loads, 'hits': self.hits, 'load_time': self.load_time,
+                'images': len(self.images), 'sounds': len(self.sounds), 'fonts': len(self.fonts)}
+
+
+# shared by every module of the game
+assets = AssetRegistry()
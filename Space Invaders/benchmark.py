@@ -0,0 +1,383 @@
+import os
+import gc
+import time
+
+# run without opening a window or an audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import random
+import pygame
+import game as game_module
+from alien import Alien
+from assets import assets, resource_path
+from formation import Formation
+from bullet import BulletBatch
+from replay import ReplaySession, seed_session
+
+
+class UncachedAlien(Alien):
+    """ An alien loading its own images and sound, like every alien did before the asset registry """
+
+    def __init__(self, *args):
+        """ Initialize the alien and load its assets from disk """
+        super().__init__(*args)
+        self.image = pygame.image.load(resource_path('resources/alien.png'))
+        self.img = pygame.image.load(resource_path('resources/red_laser.png'))
+        self.fire_sound = pygame.mixer.Sound(resource_path('resources/alien_fire.wav'))
+
+
+def time_new_rounds(game, rounds):
+    """ Time the average new round of a game in milliseconds """
+    start = time.perf_counter()
+    for i in range(rounds):
+        game.new_round()
+
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def benchmark_round_transition(rounds=20):
+    """ Compare the time a new round takes with aliens loading their assets against the shared registry """
+    window = pygame.display.get_surface()
+    player = pygame.sprite.Sprite()
+    player.lives = 3
+
+    game = game_module.Game(window, player, pygame.sprite.Group(), Formation(window.get_width()),
+                            pygame.sprite.Group())
+
+    game_module.Alien = UncachedAlien
+    uncached = time_new_rounds(game, rounds)
+
+    game_module.Alien = Alien
+    cached = time_new_rounds(game, rounds)
+
+    stats = assets.stats()
+    print(f'New round of 50 aliens, average of {rounds} rounds')
+    print(f'{"loading per alien (ms)":>24} {"shared assets (ms)":>20}')
+    print(f'{uncached:>24.3f} {cached:>20.3f}')
+    print(f'Registry: {stats["loads"]} loads in {stats["load_time"] * 1000:.1f} ms, {stats["hits"]} shared uses')
+
+
+class EdgeCheckingAlien(pygame.sprite.Sprite):
+    """ An alien moving on its own and turning the whole group at an edge, like aliens did before formations """
+
+    def __init__(self, x, y, window_width, alien_group):
+        """ Initialize the alien """
+        super().__init__()
+        self.rect = pygame.Rect(x, y, 64, 64)
+        self.w_w = window_width
+        self.alien_group = alien_group
+        self.dx = 1
+        self.velocity = 3
+
+    def update(self):
+        """ Move the alien, every alien of the group turns when it reaches an edge """
+        self.rect.x += self.dx * self.velocity
+
+        if self.rect.x > self.w_w - 64 or self.rect.x < 0:
+            for alien in self.alien_group.sprites():
+                alien.dx *= -1
+                alien.rect.y += 20
+
+
+def time_frames(group, frames, window=None):
+    """ Time the average frame of updating a group, and drawing it when a window is given, in milliseconds """
+    start = time.perf_counter()
+    for frame in range(frames):
+        group.update()
+        if window:
+            group.draw(window)
+
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def benchmark_formation(alien_counts, frames=300):
+    """ Compare moving and drawing aliens one by one against moving and drawing them as a formation """
+    window = pygame.display.get_surface()
+    window_width = window.get_width()
+    image = assets.image('alien.png')
+
+    print(f'Aliens, time per frame over {frames} frames')
+    print(f'{"":>8} {"movement":>31} {"movement and drawing":>31}')
+    print(f'{"aliens":>8} {"per alien (ms)":>15} {"formation (ms)":>15} {"per alien (ms)":>15} '
+          f'{"formation (ms)":>15}')
+    for count in alien_counts:
+        columns = max(1, window_width // 80 - 2)
+        positions = [((i % columns) * 80, 75 + (i // columns) * 50) for i in range(count)]
+
+        times = []
+        for window_drawn in [None, window]:
+            alien_group = pygame.sprite.RenderUpdates()
+            for x, y in positions:
+                alien = EdgeCheckingAlien(x, y, window_width, alien_group)
+                alien.image = image
+                alien_group.add(alien)
+
+            # the aliens of a formation are placed from its origin only when they are drawn
+            formation = Formation(window_width)
+            for x, y in positions:
+                alien = pygame.sprite.Sprite()
+                alien.image = image
+                alien.rect = image.get_rect(topleft=(x, y))
+                formation.add(alien)
+
+            times += [time_frames(alien_group, frames, window_drawn), time_frames(formation, frames, window_drawn)]
+
+        print(f'{count:>8}' + ''.join(f' {value:>15.3f}' for value in times))
+
+
+class SpriteBullet(pygame.sprite.Sprite):
+    """ A bullet moving and deleting itself, like bullets did before they were batched """
+
+    def __init__(self, x, y, img, dy, bullet_group):
+        """ Initialize the bullet """
+        super().__init__()
+        self.image = img
+        self.rect = self.image.get_rect()
+        self.rect.centerx = x
+        self.rect.top = y
+        self.dy = dy
+        self.w_w, self.w_h = pygame.display.get_surface().get_size()
+        self.bullet_group = bullet_group
+
+        self.velocity = 10
+
+    def update(self):
+        """ Move the bullet and delete it out of the screen """
+        self.rect.y += self.velocity * self.dy
+        if self.rect.y > self.w_h or self.rect.y < 0:
+            self.bullet_group.remove(self)
+
+
+def benchmark_bullets(bullet_counts, frames=60):
+    """ Compare spawning, moving and drawing bullets as sprites against a bullet batch """
+    window = pygame.display.get_surface()
+    window_width, window_height = window.get_size()
+    image = assets.image('red_laser.png')
+
+    print(f'Bullets kept on screen, time per frame over {frames} frames')
+    print(f'{"bullets":>8} {"sprites (ms)":>13} {"batch (ms)":>11}')
+    for count in bullet_counts:
+        rng = random.Random(count)
+
+        bullet_group = pygame.sprite.RenderUpdates()
+        start = time.perf_counter()
+        for frame in range(frames):
+            for i in range(count - len(bullet_group)):
+                bullet_group.add(SpriteBullet(rng.randrange(window_width), 75, image, 1, bullet_group))
+            bullet_group.update()
+            bullet_group.draw(window)
+        sprites = (time.perf_counter() - start) * 1000 / frames
+
+        bullet_batch = BulletBatch(image, 10, window_height, count)
+        start = time.perf_counter()
+        for frame in range(frames):
+            missing = count - len(bullet_batch)
+            bullet_batch.fire_many([rng.randrange(window_width) for i in range(missing)], [75] * missing)
+            bullet_batch.update()
+            bullet_batch.draw(window)
+        batch = (time.perf_counter() - start) * 1000 / frames
+
+        print(f'{count:>8} {sprites:>13.3f} {batch:>11.3f}')
+
+
+def make_collision_scene(alien_count, bullet_count, window_width, rng):
+    """ Create aliens in a formation and bullets spread over it, also as sprite groups """
+    alien_image = assets.image('alien.png')
+    bullet_image = assets.image('green_laser.png')
+    columns = max(1, window_width // 80 - 2)
+
+    formation = Formation(window_width)
+    alien_group = pygame.sprite.Group()
+    for i in range(alien_count):
+        position = ((i % columns) * 80, 75 + (i // columns) * 50)
+        formation.add(Alien(*position, pygame.sprite.Group()))
+        alien = pygame.sprite.Sprite()
+        alien.rect = alien_image.get_rect(topleft=position)
+        alien_group.add(alien)
+
+    height = 75 + (alien_count // columns + 1) * 50
+    bullet_batch = BulletBatch(bullet_image, -10, height, bullet_count)
+    bullet_group = pygame.sprite.Group()
+    for i in range(bullet_count):
+        x, y = rng.randrange(window_width), rng.randrange(height)
+        bullet_batch.fire(x, y)
+        bullet = pygame.sprite.Sprite()
+        bullet.rect = bullet_image.get_rect(centerx=x, top=y)
+        bullet_group.add(bullet)
+
+    return formation, bullet_batch, alien_group, bullet_group
+
+
+def benchmark_collisions(scenes, repeats=100):
+    """ Compare groupcollide against scanning the alien rects and the column index for bullets hitting aliens """
+    window_width = pygame.display.get_surface().get_width()
+
+    print('Bullets against aliens, time per check, the column index is built again after every kill')
+    print(f'{"aliens":>8} {"bullets":>8} {"groupcollide (ms)":>18} {"scan (ms)":>10} {"column index (ms)":>18} '
+          f'{"kills":>6} {"used":>13}')
+    for alien_count, bullet_count in scenes:
+        times = []
+        kills = []
+        for scan_limit in [None, float('inf'), 0]:
+            # the same scenes for each method, all made before the timing starts
+            collision_scenes = [make_collision_scene(alien_count, bullet_count, window_width, random.Random(i))
+                                for i in range(repeats)]
+            for formation, bullet_batch, alien_group, bullet_group in collision_scenes:
+                formation.build_index()
+                formation.SCAN_LIMIT = scan_limit
+
+            # no garbage collection of the scenes while timing, like timeit
+            killed_count = 0
+            gc.disable()
+            start = time.perf_counter()
+            for formation, bullet_batch, alien_group, bullet_group in collision_scenes:
+                if scan_limit is None:
+                    killed = pygame.sprite.groupcollide(bullet_group, alien_group, True, True)
+                    killed_count += sum(len(aliens) for aliens in killed.values())
+                else:
+                    killed_count += len(formation.collide_bullets(bullet_batch))
+            times.append((time.perf_counter() - start) * 1000 / repeats)
+            gc.enable()
+            kills.append(killed_count)
+
+        assert kills[0] == kills[1] == kills[2]
+
+        used = 'scan' if alien_count * bullet_count <= Formation.SCAN_LIMIT else 'column index'
+        print(f'{alien_count:>8} {bullet_count:>8} {times[0]:>18.3f} {times[1]:>10.3f} {times[2]:>18.3f} '
+              f'{kills[0] / repeats:>6.1f} {used:>13}')
+
+
+def measure_idle_cpu(wait_for_event, seconds=2):
+    """ Run a pause loop for some seconds, returns the share of one core it used """
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    while time.perf_counter() - wall_start < seconds:
+        wait_for_event()
+
+    return (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+
+
+def benchmark_idle_cpu(seconds=2):
+    """ Compare the CPU used on a pause screen by polling events against the waiting state machine """
+    window = pygame.display.get_surface()
+    player = pygame.sprite.Sprite()
+    player.lives = 3
+    game = game_module.Game(window, player, pygame.sprite.Group(), Formation(window.get_width()),
+                            pygame.sprite.Group())
+    game.draw_pause()
+
+    def poll():
+        """ The old pause loop, checking for events as fast as it can """
+        for event in pygame.event.get():
+            game.handle_pause_event(event)
+
+    def wait():
+        """ The title state of the main loop, sleeping until an event or the timeout """
+        game.handle_pause_event(pygame.event.wait(game_module.PAUSE_TIMEOUT))
+
+    print(f'CPU used on the title screen over {seconds} s, share of one core')
+    print(f'{"polling":>8} {"waiting":>8}')
+    print(f'{measure_idle_cpu(poll, seconds):>8.0%} {measure_idle_cpu(wait, seconds):>8.0%}')
+
+
+def check_replay_hit_and_breach():
+    """ Play a frame where the player is hit as the aliens breach and check the replay waits like the live game """
+    session = ReplaySession(pygame.display.get_surface())
+    game = session.game
+    player = session.player
+    seed_session(0)
+    # the title screen, then the first round
+    session.play_frame(0, False)
+
+    # the formation past the breach line and an alien bullet reaching the player on the next update
+    game.alien_group.y += game.w_h - 100 - game.alien_group.get_bottom() + 1
+    game.alien_bullet_group.fire(player.rect.centerx, player.rect.top - game.alien_bullet_group.velocity)
+
+    # the live game only checks for a breach while playing, the hit pauses it first
+    session.play_frame(0, False)
+    assert (game.state, player.lives, game.round) == (game_module.HIT, 2, 1)
+
+    # the breach ends the game on the frame after the player carried on
+    session.play_frame(0, False)
+    assert (game.state, player.lives, game.round) == (game_module.GAME_OVER, 2, 1)
+
+    session.play_frame(0, False)
+    assert (game.state, player.lives, game.round, game.score) == (game_module.PLAYING, 3, 1, 0)
+    print('Replay of a hit and a breach on the same frame: waits like the live game')
+
+
+def benchmark_screen_size(display_sizes, logical_size=(1280, 720), frames=60):
+    """ Compare drawing and presenting a frame at the display size against drawing it at the fixed logical size and
+    scaling it to the display, then check what a partial update costs on a SCALED window """
+    alien_image = assets.image('alien.png')
+    alien_positions = [(i * 80, 75 + j * 50) for i in range(10) for j in range(5)]
+
+    def draw_frame(surface, frame_background):
+        """ Clear a surface with the background and draw a round of aliens """
+        surface.blit(frame_background, (0, 0))
+        surface.blits([(alien_image, position) for position in alien_positions], False)
+
+    print(f'Drawing and presenting a frame, time per frame over {frames} frames')
+    print(f'{"display":>10} {"display size (ms)":>18} {"logical size scaled (ms)":>25}')
+    for width, height in display_sizes:
+        display = pygame.display.set_mode((width, height))
+        screen_background = pygame.Surface((width, height)).convert()
+        logical_screen = pygame.Surface(logical_size).convert()
+        background = pygame.Surface(logical_size).convert()
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            draw_frame(display, screen_background)
+            pygame.display.flip()
+        display_time = (time.perf_counter() - start) * 1000 / frames
+
+        # scaled in software, what the SCALED renderer does when there is no GPU to do it
+        start = time.perf_counter()
+        for frame in range(frames):
+            draw_frame(logical_screen, background)
+            pygame.transform.scale(logical_screen, (width, height), display)
+            pygame.display.flip()
+        scaled_time = (time.perf_counter() - start) * 1000 / frames
+
+        print(f'{width:>5}x{height:<4} {display_time:>18.3f} {scaled_time:>25.3f}')
+
+    # the renderer behind SCALED presents the whole frame however little is updated, it needs a new display
+    pygame.display.quit()
+    pygame.display.init()
+    window = pygame.display.set_mode(logical_size, pygame.SCALED)
+    small_rect = pygame.Rect(0, 0, 64, 64)
+    update_times = []
+    for rects in [None, [small_rect]]:
+        start = time.perf_counter()
+        for frame in range(frames):
+            window.fill((frame, 0, 0), small_rect)
+            pygame.display.update(rects)
+        update_times.append((time.perf_counter() - start) * 1000 / frames)
+
+    print(f'SCALED window: whole frame update {update_times[0]:.3f} ms, one 64x64 rect update '
+          f'{update_times[1]:.3f} ms')
+    pygame.display.quit()
+    pygame.display.init()
+    pygame.display.set_mode(logical_size)
+
+
+if __name__ == '__main__':
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+
+    check_replay_hit_and_breach()
+    print()
+    benchmark_round_transition()
+    print()
+    benchmark_formation([50, 200, 500, 2000])
+    print()
+    benchmark_bullets([100, 1000, 5000, 20000])
+    print()
+    benchmark_collisions([(50, 3), (50, 50), (500, 10), (500, 500), (5000, 5000)])
+    print()
+    benchmark_idle_cpu()
+    print()
+    benchmark_screen_size([(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)])
+
+    pygame.quit()
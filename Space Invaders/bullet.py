@@ -1,36 +1,101 @@
-import pygame
-import os
-import sys
+import numpy as np
 
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    base_path = getattr(sys, '_MEIPASS', os.path.dirname(
-        os.path.abspath(__file__)))
-    return os.path.join(base_path, relative_path)
+class BulletBatch:
+    """ The Bullets of One Side, Kept in Arrays And Moved, Culled And Drawn Together """
 
+    def __init__(self, image, velocity, window_height, capacity=64):
+        """ Initialize The Batch, Every Bullet Uses The Image And Moves velocity Pixels Down a Frame """
+        self.image = image
+        self.w, self.h = image.get_size()
+        self.velocity = velocity
+        self.w_h = window_height
 
-class Bullet(pygame.sprite.Sprite):
-    """ A Bullet Class """
-    def __init__(self, x, y, img, dy, bullet_group):
-        """ Initialize the Bullet """
-        super().__init__()
-        self.image = img
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.top = y
-        self.dy = dy
-        self.w_w, self.w_h = pygame.display.get_surface().get_size()
-        self.bullet_group = bullet_group
+        # top left corner and vertical velocity of each bullet, only the first count rows are in use
+        self.positions = np.zeros((capacity, 2), dtype=np.int64)
+        self.velocities = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
 
-        self.velocity = 10
+        # where the bullets were drawn last frame, for clearing them
+        self.drawn_rects = []
+
+    def __len__(self):
+        """ The Number of Bullets in Flight """
+        return self.count
+
+    def fire(self, x, y):
+        """ Add a Bullet Centred on x With Its Top at y """
+        self.fire_many([x], [y])
+
+    def fire_many(self, xs, ys, velocities=None):
+        """ Add a Bullet for Each x, y Pair, With The Batch Velocity Unless Given """
+        xs = np.asarray(xs, dtype=np.int64)
+        count = self.count + len(xs)
+        if count > len(self.positions):
+            self.grow(max(count, 2 * len(self.positions)))
+
+        self.positions[self.count:count, 0] = xs - self.w // 2
+        self.positions[self.count:count, 1] = ys
+        self.velocities[self.count:count] = self.velocity if velocities is None else velocities
+        self.count = count
+
+    def grow(self, capacity):
+        """ Make Room for capacity Bullets """
+        positions = np.zeros((capacity, 2), dtype=np.int64)
+        positions[:self.count] = self.positions[:self.count]
+        velocities = np.zeros(capacity, dtype=np.int64)
+        velocities[:self.count] = self.velocities[:self.count]
+
+        self.positions = positions
+        self.velocities = velocities
+
+    def keep(self, mask):
+        """ Keep The Bullets Where mask Is True, Packed at The Start of The Arrays """
+        count = int(np.count_nonzero(mask))
+        if count == self.count:
+            return
+
+        self.positions[:count] = self.positions[:self.count][mask]
+        self.velocities[:count] = self.velocities[:self.count][mask]
+        self.count = count
+
+    def empty(self):
+        """ Remove Every Bullet """
+        self.count = 0
 
     def update(self):
-        """ Move The Bullet """
-        self.rect.y += self.velocity * self.dy
-        self.delete_bullet()
-
-    def delete_bullet(self):
-        """ Delete the Bullet if it is out of the screen"""
-        if self.rect.y > self.w_h or self.rect.y < 0:
-            self.bullet_group.remove(self)
+        """ Move Every Bullet And Delete The Ones Out of The Screen """
+        positions = self.positions[:self.count]
+        positions[:, 1] += self.velocities[:self.count]
+
+        self.keep((positions[:, 1] >= 0) & (positions[:, 1] <= self.w_h))
+
+    def draw(self, surface):
+        """ Draw Every Bullet With One blits Call, Returns The Areas to Update Like RenderUpdates.draw """
+        image = self.image
+        drawn_rects = surface.blits([(image, position) for position in self.positions[:self.count].tolist()])
+
+        dirty_rects = self.drawn_rects + drawn_rects
+        self.drawn_rects = drawn_rects
+
+        return dirty_rects
+
+    def clear(self, surface, background):
+        """ Erase The Bullets Where They Were Drawn Last Frame """
+        surface.blits([(background, rect, rect) for rect in self.drawn_rects], False)
+
+    def get_boxes(self):
+        """ Get an Array of The Left, Top, Width And Height of Every Bullet """
+        boxes = np.empty((self.count, 4), dtype=np.int64)
+        boxes[:, :2] = self.positions[:self.count]
+        boxes[:, 2] = self.w
+        boxes[:, 3] = self.h
+
+        return boxes
+
+    def collides_with(self, rect):
+        """ Check if Any Bullet Overlaps The Rect """
+        positions = self.positions[:self.count]
+
+        return bool(np.any((positions[:, 0] < rect.right) & (positions[:, 0] + self.w > rect.left) &
+                           (positions[:, 1] < rect.bottom) & (positions[:, 1] + self.h > rect.top)))
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class ColumnIndex:
+    """ Boxes bucketed by the column their left edge is in, and by row inside a column """
+
+    def __init__(self, boxes, column_width, row_height):
+        """ Initialize the index, boxes is an (n, 4) array of left, top, width, height none bigger than a cell """
+        self.boxes = boxes
+        self.column_width = column_width
+        self.row_height = row_height
+
+        columns = boxes[:, 0] // column_width
+        rows = boxes[:, 1] // row_height
+        self.first_column = int(columns.min())
+        self.first_row = int(rows.min())
+        self.last_row = int(rows.max())
+
+        # box numbers sorted column by column, top to bottom, and the cell key of each of them
+        keys = self.get_keys(columns, rows)
+        self.order = np.argsort(keys, kind='stable')
+        self.keys = keys[self.order]
+
+    def get_keys(self, columns, rows):
+        """ Number the cells so each column is one run of keys """
+        row_count = self.last_row - self.first_row + 1
+        return (columns - self.first_column) * row_count + rows - self.first_row
+
+    def overlapping_pairs(self, boxes, dx=0, dy=0):
+        """ Find the pairs of a box and an indexed box moved by dx, dy that overlap """
+        # in the coordinates of the index
+        left = boxes[:, 0] - dx
+        top = boxes[:, 1] - dy
+        right = left + boxes[:, 2]
+        bottom = top + boxes[:, 3]
+
+        # an indexed box reaches at most one cell past its own, so look one column and one row further back
+        first_columns = left // self.column_width - 1
+        last_columns = (right - 1) // self.column_width
+        first_rows = np.maximum(top // self.row_height - 1, self.first_row)
+        last_rows = np.minimum((bottom - 1) // self.row_height, self.last_row)
+
+        # one pass per column a box spans, every box looks up its run of rows in that column
+        box_numbers = []
+        indexed_numbers = []
+        for column_offset in range(int((last_columns - first_columns).max(initial=0)) + 1):
+            columns = first_columns + column_offset
+            starts = np.searchsorted(self.keys, self.get_keys(columns, first_rows), 'left')
+            ends = np.searchsorted(self.keys, self.get_keys(columns, last_rows), 'right')
+            counts = np.where((columns <= last_columns) & (first_rows <= last_rows), np.maximum(ends - starts, 0), 0)
+
+            # every candidate pair, one row each
+            within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            box_numbers.append(np.repeat(np.arange(len(boxes)), counts))
+            indexed_numbers.append(self.order[np.repeat(starts, counts) + within])
+
+        box_numbers = np.concatenate(box_numbers)
+        indexed_numbers = np.concatenate(indexed_numbers)
+
+        # the pair tests, same rule as Rect.colliderect
+        indexed = self.boxes[indexed_numbers]
+        overlaps = ((left[box_numbers] < indexed[:, 0] + indexed[:, 2]) &
+                    (right[box_numbers] > indexed[:, 0]) &
+                    (top[box_numbers] < indexed[:, 1] + indexed[:, 3]) &
+                    (bottom[box_numbers] > indexed[:, 1]))
+
+        return box_numbers[overlaps], indexed_numbers[overlaps]
@@ -0,0 +1,183 @@
+import numpy as np
+import pygame
+from collision import ColumnIndex
+
+
+class Formation(pygame.sprite.RenderUpdates):
+    """ The aliens of a round, moved as one block from their offsets kept in an array """
+
+    # up to this many bullet and alien pairs a plain scan of the alien rects is faster than the column index
+    SCAN_LIMIT = 8000
+
+    def __init__(self, window_width, *sprites):
+        """ Initialize the formation """
+        self.w_w = window_width
+
+        # the formation origin, every alien is placed at origin + its offset
+        self.x = 0
+        self.y = 0
+        self.dx = 1
+        self.velocity = 3
+        self.drop = 20
+        self.round = 1
+
+        # members in the order of the offset rows, rebuilt after aliens are added or removed
+        self.members = []
+        self.images = []
+        self.offsets = np.zeros((0, 2), dtype=np.int64)
+        self.local_rects = []
+        self.left = self.right = self.bottom = 0
+        self.boxes = None
+        self.column_index = None
+        self.is_indexed = False
+
+        # where the aliens were drawn last frame, for clearing them, their own rects are only placed when needed
+        self.drawn_rects = []
+
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """ Add an alien, its offset is where it is now relative to the origin """
+        super().add_internal(sprite, layer)
+        sprite.offset = (sprite.rect.x - self.x, sprite.rect.y - self.y)
+        sprite.formation = self
+        self.is_indexed = False
+
+    def remove_internal(self, sprite):
+        """ Remove an alien, the offsets are rebuilt on the next update """
+        super().remove_internal(sprite)
+        self.place(sprite)
+        sprite.formation = None
+        self.is_indexed = False
+
+    def reset(self, round):
+        """ Move the origin back for a new round, add the new aliens after this """
+        self.x = 0
+        self.y = 0
+        self.dx = 1
+        self.round = round
+
+    def build_index(self):
+        """ Put the offsets of the members in one array and find the edges of the formation """
+        self.members = self.sprites()
+        self.images = [sprite.image for sprite in self.members]
+        self.offsets = np.array([sprite.offset for sprite in self.members], dtype=np.int64).reshape(-1, 2)
+
+        if self.members:
+            sizes = np.array([sprite.rect.size for sprite in self.members], dtype=np.int64)
+            boxes = np.hstack((self.offsets, sizes))
+            self.left = int(boxes[:, 0].min())
+            self.right = int((boxes[:, 0] + boxes[:, 2]).max())
+            self.bottom = int((boxes[:, 1] + boxes[:, 3]).max())
+            self.boxes = boxes
+            # the rects of the aliens relative to the origin, for scanning a few bullets
+            self.local_rects = [pygame.Rect(box) for box in boxes.tolist()]
+        else:
+            self.local_rects = []
+
+        # the column index is only built once it is needed
+        self.column_index = None
+        self.is_indexed = True
+
+    def get_column_index(self):
+        """ Get the column index of the aliens, built on first use after aliens are added or removed """
+        if self.column_index is None:
+            # the aliens sit in a grid, so cells as big as the biggest alien hold few of them each
+            sizes = self.boxes[:, 2:]
+            self.column_index = ColumnIndex(self.boxes, int(sizes[:, 0].max()), int(sizes[:, 1].max()))
+
+        return self.column_index
+
+    def place(self, sprite):
+        """ Move the rect of an alien to where it is in the formation now """
+        sprite.rect.topleft = (self.x + sprite.offset[0], self.y + sprite.offset[1])
+
+    def get_bottom(self):
+        """ Get the lowest point of the formation on the screen """
+        if not self.is_indexed:
+            self.build_index()
+
+        return self.y + self.bottom
+
+    def collide_bullets(self, bullets):
+        """ Kill the aliens hit by a BulletBatch and delete those bullets, returns the aliens killed """
+        if not self.is_indexed:
+            self.build_index()
+        if not self.members or not len(bullets):
+            return []
+
+        if len(bullets) * len(self.members) <= self.SCAN_LIMIT:
+            return self.scan_bullets(bullets)
+
+        bullet_numbers, alien_numbers = self.get_column_index().overlapping_pairs(bullets.get_boxes(),
+                                                                                  self.x, self.y)
+        if not len(alien_numbers):
+            return []
+
+        # like groupcollide, an alien goes to the first bullet overlapping it and a bullet takes every alien it gets
+        pair_order = np.lexsort((bullet_numbers, alien_numbers))
+        alien_numbers, first_pairs = np.unique(alien_numbers[pair_order], return_index=True)
+        is_spent = np.zeros(len(bullets), dtype=bool)
+        is_spent[bullet_numbers[pair_order][first_pairs]] = True
+
+        return self.kill_aliens(alien_numbers.tolist(), is_spent, bullets)
+
+    def scan_bullets(self, bullets):
+        """ Same as collide_bullets, every bullet is tested against the alien rects one after the other """
+        killed_numbers = set()
+        is_spent = np.zeros(len(bullets), dtype=bool)
+        for i, (x, y) in enumerate(bullets.positions[:len(bullets)].tolist()):
+            # in the coordinates of the offsets, the aliens taken by an earlier bullet are not taken again
+            hits = pygame.Rect(x - self.x, y - self.y, bullets.w, bullets.h).collidelistall(self.local_rects)
+            hits = [number for number in hits if number not in killed_numbers]
+            if hits:
+                is_spent[i] = True
+                killed_numbers.update(hits)
+
+        if not killed_numbers:
+            return []
+
+        return self.kill_aliens(sorted(killed_numbers), is_spent, bullets)
+
+    def kill_aliens(self, alien_numbers, is_spent, bullets):
+        """ Kill the aliens of the numbers and delete the spent bullets, returns the aliens killed """
+        bullets.keep(~is_spent)
+
+        killed_aliens = [self.members[i] for i in alien_numbers]
+        for alien in killed_aliens:
+            alien.kill()
+
+        return killed_aliens
+
+    def update(self, *args, **kwargs):
+        """ Move the formation, turn and drop once when it reaches an edge, then update the aliens """
+        if not self.is_indexed:
+            self.build_index()
+
+        # only the origin moves, the aliens are placed from it when they are drawn or fire
+        if self.members:
+            self.x += self.dx * self.velocity
+
+            # one check for the whole formation
+            if self.x + self.right > self.w_w or self.x + self.left < 0:
+                self.dx *= -1
+                self.y += self.drop * self.round
+
+        super().update(*args, **kwargs)
+
+    def draw(self, surface):
+        """ Draw every alien at its place with one blits call, returns the areas to update like RenderUpdates.draw """
+        if not self.is_indexed:
+            self.build_index()
+
+        positions = (self.offsets + (self.x, self.y)).tolist()
+        drawn_rects = surface.blits(zip(self.images, positions))
+
+        dirty_rects = self.drawn_rects + drawn_rects
+        self.drawn_rects = drawn_rects
+
+        return dirty_rects
+
+    def clear(self, surface, background):
+        """ Erase the aliens where they were drawn last frame """
+        surface.blits([(background, rect, rect) for rect in self.drawn_rects], False)
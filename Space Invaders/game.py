@@ -1,14 +1,16 @@
 import pygame
-import sys
-import os
 from alien import Alien
+from text_cache import text_cache, CachedText
+from assets import assets
 
+# the states of a game, every state but playing waits for the player
+TITLE = 'title'
+PLAYING = 'playing'
+HIT = 'hit'
+GAME_OVER = 'game over'
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller """
-    base_path = getattr(sys, '_MEIPASS', os.path.dirname(
-        os.path.abspath(__file__)))
-    return os.path.join(base_path, relative_path)
+# a paused game sleeps until an event comes, waking up at least this often (ms)
+PAUSE_TIMEOUT = 250
 
 
 class Game:
@@ -26,10 +28,27 @@ class Game:
         self.alien_bullet_group = alien_bullet_group
         self.w_w, self.w_h = window.get_size()
 
-        self.new_round_sound = pygame.mixer.Sound(resource_path('resources/new_round.wav'))
-        self.breach = pygame.mixer.Sound(resource_path('resources/breach.wav'))
+        self.new_round_sound = assets.sound('new_round.wav')
+        self.breach = assets.sound('breach.wav')
 
-        self.font = pygame.font.Font(resource_path('resources/Facon.ttf'), 50)
+        self.font = assets.font('Facon.ttf', 50)
+
+        # HUD text, rendered again only when its value changes
+        white = (255, 255, 255)
+        self.round_text = CachedText(self.font, 'Round: {}', True, white)
+        self.score_text = CachedText(self.font, 'Score: {}', True, white)
+        self.lives_text = CachedText(self.font, 'Lives: {}', True, white)
+
+        # dirty rect rendering, the background holds the lines and the HUD text
+        self.background = self.make_background()
+        self.hud_rect = pygame.Rect(0, 0, self.w_w, 68)
+        self.hud_state = None
+        self.is_redraw_needed = True
+
+        # a game starts on the title screen
+        self.state = TITLE
+        self.pause_texts = ('Space Invaders', "Press 'Enter' to Play", "Press 'Esc' to Quit")
+        self.is_pause_drawn = False
 
     def update(self):
         """ Update The Game Object"""
@@ -40,57 +59,93 @@ class Game:
         # colours
         white = (255, 255, 255)
 
+        self.draw_hud_text(self.window)
+        pygame.draw.line(self.window, white, (0, 70), (self.w_w, 70), 3)
+        pygame.draw.line(self.window, white, (0, self.w_h - 100), (self.w_w, self.w_h - 100), 3)
+
+    def draw_hud_text(self, surface):
+        """ Draw The Round, Score And Lives Text"""
         # text
-        round_text = self.font.render(f'Round: {self.round}', True, white)
+        round_text = self.round_text.render(self.round)
         round_rect = round_text.get_rect()
         round_rect.topleft = (10, 10)
 
-        score_text = self.font.render(f'Score: {self.score}', True, white)
+        score_text = self.score_text.render(self.score)
         score_rect = score_text.get_rect()
         score_rect.centerx = self.w_w // 2
         score_rect.top = 10
 
-        lives_text = self.font.render(f'Lives: {self.player.lives}', True, white)
+        lives_text = self.lives_text.render(self.player.lives)
         lives_rect = lives_text.get_rect()
         lives_rect.topright = (self.w_w - 10, 10)
 
         # blit the HUD
-        self.window.blit(round_text, round_rect)
-        self.window.blit(score_text, score_rect)
-        self.window.blit(lives_text, lives_rect)
-        pygame.draw.line(self.window, white, (0, 70), (self.w_w, 70), 3)
-        pygame.draw.line(self.window, white, (0, self.w_h - 100), (self.w_w, self.w_h - 100), 3)
+        surface.blit(round_text, round_rect)
+        surface.blit(score_text, score_rect)
+        surface.blit(lives_text, lives_rect)
+
+    def make_background(self):
+        """ Create The Background Sprites Are Cleared With """
+        # colours
+        white = (255, 255, 255)
+        black = (0, 0, 0)
+
+        background = pygame.Surface((self.w_w, self.w_h)).convert()
+        background.fill(black)
+        pygame.draw.line(background, white, (0, 70), (self.w_w, 70), 3)
+        pygame.draw.line(background, white, (0, self.w_h - 100), (self.w_w, self.w_h - 100), 3)
+
+        return background
+
+    def draw_changes(self):
+        """ Draw The Screen Areas That Changed, Returns The Rects to Update """
+        # after a pause the whole screen has to be drawn again
+        if self.is_redraw_needed:
+            self.is_redraw_needed = False
+            self.hud_state = None
+            self.window.blit(self.background, (0, 0))
+            dirty_rects = [self.window.get_rect()]
+        else:
+            dirty_rects = []
+
+        # redraw the HUD only when its values change
+        hud_state = (self.round, self.score, self.player.lives)
+        if hud_state != self.hud_state:
+            self.hud_state = hud_state
+            self.background.fill((0, 0, 0), self.hud_rect)
+            self.draw_hud_text(self.background)
+            self.window.blit(self.background, self.hud_rect, self.hud_rect)
+            dirty_rects.append(self.hud_rect)
+
+        return dirty_rects
 
     def check_collision(self):
         """ Check for Collision Between The Bullets And The Aliens """
-        killed_alien = pygame.sprite.groupcollide(self.player_bullet_group, self.alien_group, True, True)
+        killed_alien = self.alien_group.collide_bullets(self.player_bullet_group)
         if killed_alien:
             self.score += 100 * self.round
             if not self.alien_group:
                 self.player.reset()
                 self.new_round()
 
-        killed_ship = pygame.sprite.spritecollideany(self.player, self.alien_bullet_group)
+        killed_ship = self.alien_bullet_group.collides_with(self.player.rect)
         if killed_ship:
             self.player.lives -= 1
             self.player.hit_sound.play()
             self.player.reset()
             # remove bullets
-            for bullet in self.alien_bullet_group:
-                self.alien_bullet_group.remove(bullet)
-            for bullet in self.player_bullet_group:
-                self.player_bullet_group.remove(bullet)
+            self.alien_bullet_group.empty()
+            self.player_bullet_group.empty()
             if self.player.lives < 0:
-                self.pause_game(f'Final Score: {self.score}', "Press 'Enter' to Play Again", "Press 'Esc' to Quit")
-                self.reset_game()
+                self.pause_game(f'Final Score: {self.score}', "Press 'Enter' to Play Again", "Press 'Esc' to Quit",
+                                GAME_OVER)
             else:
-                self.pause_game(f'You got hit!', "Press 'Enter' to Continue", "Press 'Esc' to Quit")
+                self.pause_game('You got hit!', "Press 'Enter' to Continue", "Press 'Esc' to Quit", HIT)
 
-        for alien in self.alien_group.sprites():
-            if alien.rect.bottom > self.w_h - 100:
-                self.breach.play()
-                self.pause_game(f'Final Score: {self.score}', "Press 'Enter' to Play Again", "Press 'Esc' to Quit")
-                self.reset_game()
+        if self.state == PLAYING and self.alien_group and self.alien_group.get_bottom() > self.w_h - 100:
+            self.breach.play()
+            self.pause_game(f'Final Score: {self.score}', "Press 'Enter' to Play Again", "Press 'Esc' to Quit",
+                            GAME_OVER)
 
     def new_round(self):
         """ Generate New Aliens for The New Round """
@@ -99,34 +154,40 @@ class Game:
         # remove any remaining aliens/bullets
         for alien in self.alien_group:
             self.alien_group.remove(alien)
-        for bullet in self.alien_bullet_group:
-            self.alien_bullet_group.remove(bullet)
-        for bullet in self.player_bullet_group:
-            self.player_bullet_group.remove(bullet)
+        self.alien_bullet_group.empty()
+        self.player_bullet_group.empty()
 
-        # add new aliens
+        # add new aliens to the formation
+        self.alien_group.reset(self.round)
         for i in range(10):
             for j in range(5):
-                self.alien_group.add(
-                    Alien(i * 80, 75 + j * 50, self.window, self.alien_bullet_group, self.alien_group, self.round))
+                self.alien_group.add(Alien(i * 80, 75 + j * 50, self.alien_bullet_group))
 
         self.new_round_sound.play()
 
-    def pause_game(self, main_text, sub_text, sub_text1):
-        """ Pause The Game """
+    def pause_game(self, main_text, sub_text, sub_text1, state):
+        """ Pause The Game in a Waiting State, The Main Loop Draws The Pause Screen And Waits for Enter """
+        self.state = state
+        self.pause_texts = (main_text, sub_text, sub_text1)
+        self.is_pause_drawn = False
+
+    def draw_pause(self):
+        """ Draw The Pause Screen Once """
         # colours
         white = (255, 255, 255)
         black = (0, 0, 0)
 
-        main_text = self.font.render(main_text, True, white)
+        main_text, sub_text, sub_text1 = self.pause_texts
+
+        main_text = text_cache.render(self.font, main_text, True, white)
         main_rect = main_text.get_rect()
         main_rect.center = (self.w_w // 2, self.w_h // 2)
 
-        sub_text = self.font.render(sub_text, True, white)
+        sub_text = text_cache.render(self.font, sub_text, True, white)
         sub_rect = sub_text.get_rect()
         sub_rect.center = (self.w_w // 2, self.w_h // 2 + 64)
 
-        sub_text1 = self.font.render(sub_text1, True, white)
+        sub_text1 = text_cache.render(self.font, sub_text1, True, white)
         sub_rect1 = sub_text1.get_rect()
         sub_rect1.center = (self.w_w // 2, self.w_h // 2 + 128)
 
@@ -137,17 +198,29 @@ class Game:
         self.window.blit(sub_text1, sub_rect1)
 
         pygame.display.update()
-
-        is_paused = True
-        while is_paused:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        is_paused = False
-                    if event.key == pygame.K_ESCAPE:
-                        sys.exit()
-                if event.type == pygame.QUIT:
-                    sys.exit()
+        self.is_redraw_needed = True
+        self.is_pause_drawn = True
+
+    def handle_pause_event(self, event):
+        """ React to an Event While Paused, Returns False When The Player Quits """
+        if event.type == pygame.QUIT:
+            return False
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                self.resume()
+            if event.key == pygame.K_ESCAPE:
+                return False
+
+        return True
+
+    def resume(self):
+        """ Leave The Waiting State And Play """
+        if self.state == TITLE:
+            self.new_round()
+        elif self.state == GAME_OVER:
+            self.reset_game()
+
+        self.state = PLAYING
 
     def reset_game(self):
         """ Reset The Game """
@@ -1,10 +1,17 @@
 import os
 import sys
+import time
+import atexit
+import random
+import numpy as np
 import pygame
-from game import Game
+from game import Game, PLAYING, PAUSE_TIMEOUT
 from player import Player
-from alien import Alien
-from bullet import Bullet
+from formation import Formation
+from bullet import BulletBatch
+from assets import assets
+from replay import ReplayRecorder, seed_session
+from profiler import FrameProfiler, get_csv_path
 
 
 def resource_path(relative_path):
@@ -17,8 +24,16 @@ def resource_path(relative_path):
 # init pygame
 pygame.init()
 
-# set window
-window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+# pick the render path, with '--dirty-rects' only the changed areas are redrawn and updated
+DIRTY_RECTS = '--dirty-rects' in sys.argv
+
+# set window, the game is drawn on a fixed logical screen that SDL scales to fill the display, the scaling
+# renderer presents the whole frame on every update, so the dirty rect path gets a window of the logical size
+LOGICAL_SIZE = (1280, 720)
+if DIRTY_RECTS:
+    window = pygame.display.set_mode(LOGICAL_SIZE)
+else:
+    window = pygame.display.set_mode(LOGICAL_SIZE, pygame.FULLSCREEN | pygame.SCALED)
 window_width, window_height = window.get_size()
 pygame.display.set_caption('Space Invaders')
 
@@ -26,59 +41,133 @@ pygame.display.set_caption('Space Invaders')
 FPS = 60
 clock = pygame.time.Clock()
 
-# create a bullet group
-player_bullet_group = pygame.sprite.Group()
-alien_bullet_group = pygame.sprite.Group()
+# with '--stress' thousands of harmless bullets rain down and the frame time is printed against their count
+STRESS_BULLETS = 5000 if '--stress' in sys.argv else 0
+
+# with '--record <file>' the seed and the input of every frame are saved, replay.py plays them back
+RECORD_PATH = sys.argv[sys.argv.index('--record') + 1] if '--record' in sys.argv else None
+
+# create a bullet batch for each side
+player_bullet_group = BulletBatch(assets.image('green_laser.png'), -10, window_height)
+alien_bullet_group = BulletBatch(assets.image('red_laser.png'), 10, window_height)
+stress_bullet_group = BulletBatch(assets.image('red_laser.png'), 10, window_height, STRESS_BULLETS)
+frame_times = []
 
-# create an Alien group
-alien_group = pygame.sprite.Group()
+# create an Alien group, moved as one formation
+alien_group = Formation(window_width)
 
 # create player group and objet
-player_group = pygame.sprite.Group()
+player_group = pygame.sprite.RenderUpdates()
 player = Player((window_width, window_height), player_bullet_group)
 player_group.add(player)
 
-# create a game objet
+# create a game objet, it starts on the title screen
 game = Game(window, player, player_bullet_group, alien_group, alien_bullet_group)
-game.pause_game('Space Invaders', "Press 'Enter' to Play", "Press 'Esc' to Quit")
-game.new_round()
+
+# seed the session so it can be recorded, the replay is saved however the game is quit
+seed = random.randrange(2 ** 32)
+seed_session(seed)
+if RECORD_PATH:
+    recorder = ReplayRecorder(seed, (window_width, window_height))
+    atexit.register(recorder.save, RECORD_PATH)
+
+# F3 shows frame times, '--profile-csv <file>' saves them
+profiler = FrameProfiler(get_csv_path())
+overlay_rects = []
 
 # main game loop
 running = True
 while running:
+    # title, hit and game over screens wait for the player without using the CPU
+    if game.state != PLAYING:
+        if not game.is_pause_drawn:
+            game.draw_pause()
+        running = game.handle_pause_event(pygame.event.wait(PAUSE_TIMEOUT))
+        continue
+
+    frame_start = time.perf_counter()
+    profiler.start_frame()
+    is_firing = False
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 running = False
-            # player fire
+            # player fire, once a frame at most
             if event.key == pygame.K_SPACE:
-                player.fire()
+                is_firing = True
+    profiler.mark('events')
 
-    # fill the display
-    window.fill((0, 0, 0))
+    if RECORD_PATH:
+        recorder.record(pygame.key.get_pressed(), is_firing)
+    if is_firing:
+        player.fire()
 
-    # update and draw sprite groups
+    # update sprite groups
     player_group.update()
-    player_group.draw(window)
-
     player_bullet_group.update()
-    player_bullet_group.draw(window)
-
     alien_group.update()
-    alien_group.draw(window)
-
     alien_bullet_group.update()
-    alien_bullet_group.draw(window)
 
-    # update and draw the game
+    if STRESS_BULLETS:
+        # keep the screen full of bullets falling at different speeds
+        missing = STRESS_BULLETS - len(stress_bullet_group)
+        stress_bullet_group.fire_many(np.random.randint(0, window_width, missing), np.full(missing, 75),
+                                      np.random.randint(2, 11, missing))
+        stress_bullet_group.update()
+    profiler.mark('update')
+
+    # update the game
     game.update()
-    game.draw()
+    profiler.mark('collision')
+
+    if DIRTY_RECTS:
+        # erase the sprites where they were drawn last frame
+        for group in [player_group, player_bullet_group, alien_group, alien_bullet_group, stress_bullet_group]:
+            group.clear(window, game.background)
+
+        # redraw the HUD if it changed
+        dirty_rects = game.draw_changes()
+
+        # the overlay is translucent, put back what was under it last frame before the sprites are drawn again
+        for rect in overlay_rects:
+            window.blit(game.background, rect, rect)
+        dirty_rects += overlay_rects
+    else:
+        # fill the display
+        window.fill((0, 0, 0))
+        dirty_rects = []
+
+    # draw sprite groups
+    for group in [player_group, player_bullet_group, alien_group, alien_bullet_group, stress_bullet_group]:
+        dirty_rects += group.draw(window)
+
+    # draw the game and the profiler overlay
+    if not DIRTY_RECTS:
+        game.draw()
+    overlay_rects = profiler.draw(window)
+    dirty_rects += overlay_rects
+    profiler.mark('draw')
 
     # update window and tick the clock
-    pygame.display.update()
+    if DIRTY_RECTS:
+        pygame.display.update(dirty_rects)
+    else:
+        pygame.display.update()
+    profiler.mark('flip')
+
+    if STRESS_BULLETS:
+        # the work of the frame, without the wait for the next one
+        frame_times.append(time.perf_counter() - frame_start)
+        if len(frame_times) == FPS:
+            print(f'{len(stress_bullet_group)} bullets: {sum(frame_times) * 1000 / FPS:.2f} ms a frame')
+            frame_times.clear()
     clock.tick(FPS)
+    profiler.mark('wait')
+    profiler.end_frame()
 
 # quit pygame
+profiler.close()
 pygame.quit()
@@ -0,0 +1,178 @@
+import os
+import time
+import struct
+import random
+import argparse
+from collections import defaultdict
+
+import numpy as np
+import pygame
+from game import Game, PLAYING
+from player import Player
+from formation import Formation
+from bullet import BulletBatch
+from assets import assets
+
+# file layout: magic, version, seed, window width and height, frame count, then 3 input bits a frame
+HEADER = struct.Struct('<4sBQHHI')
+MAGIC = b'SIRP'
+VERSION = 1
+
+# input bits of a frame
+LEFT = 1
+RIGHT = 2
+FIRE = 4
+BITS_PER_FRAME = 3
+
+
+class ReplayRecorder:
+    """ Collects the seed and the input of every frame of a session """
+
+    def __init__(self, seed, window_size):
+        """ Initialize the recorder """
+        self.seed = seed
+        self.window_size = window_size
+        # one byte of input bits a frame until the replay is saved
+        self.inputs = bytearray()
+
+    def record(self, keys, is_firing):
+        """ Record the keys held and whether the player fired this frame """
+        bits = 0
+        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+            bits |= LEFT
+        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+            bits |= RIGHT
+        if is_firing:
+            bits |= FIRE
+
+        self.inputs.append(bits)
+
+    def save(self, path):
+        """ Write the replay, the input bits are packed into a bitstream """
+        inputs = np.frombuffer(bytes(self.inputs), dtype=np.uint8)
+        # keep the low 3 bits of each frame, fire, right, left
+        bits = np.unpackbits(inputs[:, np.newaxis], axis=1)[:, -BITS_PER_FRAME:]
+
+        with open(path, 'wb') as replay_file:
+            replay_file.write(HEADER.pack(MAGIC, VERSION, self.seed, *self.window_size, len(inputs)))
+            replay_file.write(np.packbits(bits).tobytes())
+
+
+def load_replay(path):
+    """ Read a replay, returns the seed, the window size and an array of input bits a frame """
+    with open(path, 'rb') as replay_file:
+        magic, version, seed, width, height, frames = HEADER.unpack(replay_file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a Space Invaders replay')
+        stream = np.frombuffer(replay_file.read(), dtype=np.uint8)
+
+    # each frame is stored fire, right, left, highest bit first
+    bits = np.unpackbits(stream)[:frames * BITS_PER_FRAME].reshape(frames, BITS_PER_FRAME)
+    inputs = bits @ np.array([FIRE, RIGHT, LEFT], dtype=np.uint8)
+
+    return seed, (width, height), inputs
+
+
+def seed_session(seed):
+    """ Seed every random generator the game uses """
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+class ReplayKeyboard:
+    """ Keys held down read from a replay, same interface as pygame.key for the player """
+
+    def __init__(self):
+        """ Initialize the keyboard """
+        self.pressed = defaultdict(bool)
+
+    def set_input(self, bits):
+        """ Hold the keys of a frame """
+        self.pressed[pygame.K_LEFT] = bool(bits & LEFT)
+        self.pressed[pygame.K_RIGHT] = bool(bits & RIGHT)
+
+    def get_pressed(self):
+        """ Get the keys held down, same as pygame.key.get_pressed """
+        return self.pressed
+
+
+class ReplaySession:
+    """ The objects of a game played from replay input, one frame at a time """
+
+    def __init__(self, window):
+        """ Initialize the session, same objects as main.py """
+        self.window = window
+        window_width, window_height = window.get_size()
+
+        player_bullet_group = BulletBatch(assets.image('green_laser.png'), -10, window_height)
+        alien_bullet_group = BulletBatch(assets.image('red_laser.png'), 10, window_height)
+        alien_group = Formation(window_width)
+        player_group = pygame.sprite.RenderUpdates()
+        self.player = Player((window_width, window_height), player_bullet_group)
+        player_group.add(self.player)
+        self.game = Game(window, self.player, player_bullet_group, alien_group, alien_bullet_group)
+        self.groups = [player_group, player_bullet_group, alien_group, alien_bullet_group]
+
+        self.keyboard = ReplayKeyboard()
+        self.player.keyboard = self.keyboard
+
+    def play_frame(self, bits, draw=True):
+        """ Play a frame with its input bits """
+        game = self.game
+
+        # a recording only has playing frames, the player pressed Enter between a pause and the next one
+        if game.state != PLAYING:
+            game.resume()
+
+        # same order as the main game loop
+        self.keyboard.set_input(bits)
+        if bits & FIRE:
+            self.player.fire()
+
+        if draw:
+            self.window.fill((0, 0, 0))
+        for group in self.groups:
+            group.update()
+            if draw:
+                group.draw(self.window)
+        game.update()
+        if draw:
+            game.draw()
+            pygame.display.update()
+
+
+def play_replay(path, draw=True):
+    """ Play a replay as fast as possible without a window, returns the frame times and the final game """
+    # no window and no audio device, set before the display starts
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    seed, window_size, inputs = load_replay(path)
+
+    pygame.init()
+    session = ReplaySession(pygame.display.set_mode(window_size))
+    seed_session(seed)
+
+    frame_times = np.zeros(len(inputs))
+    for frame, bits in enumerate(inputs.tolist()):
+        frame_start = time.perf_counter()
+        session.play_frame(bits, draw)
+        frame_times[frame] = time.perf_counter() - frame_start
+
+    return frame_times, session.game
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Play a Space Invaders replay without a window and time it')
+    parser.add_argument('replay', help="file recorded with 'main.py --record <file>'")
+    parser.add_argument('--no-draw', action='store_true', help='only simulate, skip drawing')
+    args = parser.parse_args()
+
+    frame_times, game = play_replay(args.replay, not args.no_draw)
+    elapsed = frame_times.sum()
+    p50, p95, p99 = np.percentile(frame_times * 1000, [50, 95, 99]) if len(frame_times) else (0, 0, 0)
+
+    print(f'{len(frame_times)} frames in {elapsed:.2f} s, '
+          f'{len(frame_times) / max(elapsed, 1e-9):.0f} frames per second')
+    print(f'Frame time p50 {p50:.3f} ms, p95 {p95:.3f} ms, p99 {p99:.3f} ms')
+    print(f'Final round {game.round}, score {game.score}, lives {game.player.lives}')
@@ -0,0 +1,115 @@
+import pygame
+import os
+import sys
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(
+        os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+# (character, action) -> (file name pattern, first frame number, last frame number)
+FRAME_FILES = {
+    ('player', 'run'): ('resources/images/player/run/Run ({}).png', 1, 10),
+    ('player', 'idle'): ('resources/images/player/idle/Idle ({}).png', 1, 10),
+    ('player', 'jump'): ('resources/images/player/jump/Jump ({}).png', 1, 10),
+    ('player', 'attack'): ('resources/images/player/attack/Attack ({}).png', 1, 10),
+    ('player', 'slash'): ('resources/images/player/slash.png', 1, 1),
+    ('zombie/boy', 'walk'): ('resources/images/zombie/boy/walk/Walk ({}).png', 1, 10),
+    ('zombie/boy', 'dead'): ('resources/images/zombie/boy/dead/Dead ({}).png', 1, 10),
+    ('zombie/girl', 'walk'): ('resources/images/zombie/girl/walk/Walk ({}).png', 1, 10),
+    ('zombie/girl', 'dead'): ('resources/images/zombie/girl/dead/Dead ({}).png', 1, 10),
+    ('ruby', 'spin'): ('resources/images/ruby/tile{:03d}.png', 0, 6),
+    ('portal/green', 'spin'): ('resources/images/portals/green/tile{:03d}.png', 0, 21),
+    ('portal/purple', 'spin'): ('resources/images/portals/purple/tile{:03d}.png', 0, 21),
+}
+
+# actions that play the frames of another action backwards
+REVERSED_ACTIONS = {'rise': 'dead'}
+
+
+class AnimationCache:
+    """ A process wide cache of loaded, scaled and flipped animation frames and their masks """
+
+    def __init__(self):
+        """ Initialize the cache """
+        # (character, action, size, facing) -> list of frames
+        self.frame_sets = {}
+        # frame -> collision mask, built once when the frame is created
+        self.masks = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, character, action, size, facing='right'):
+        """ Return the frames of an animation, loading them on the first request only """
+        key = (character, action, size, facing)
+        if key in self.frame_sets:
+            self.hits += 1
+            return self.frame_sets[key]
+
+        self.misses += 1
+        return self.build(key)
+
+    def build(self, key):
+        """ Create a frame set, reusing any frame set it is derived from """
+        character, action, size, facing = key
+        if action in REVERSED_ACTIONS:
+            source = (character, REVERSED_ACTIONS[action], size, facing)
+            frames = list(reversed(self.frame_sets.get(source) or self.build(source)))
+        elif facing == 'left':
+            source = (character, action, size, 'right')
+            frames = [pygame.transform.flip(frame, True, False)
+                      for frame in self.frame_sets.get(source) or self.build(source)]
+        else:
+            frames = [self.load_frame(path, size) for path in self.frame_paths(character, action)]
+
+        for frame in frames:
+            if frame not in self.masks:
+                self.masks[frame] = pygame.mask.from_surface(frame)
+
+        self.frame_sets[key] = frames
+        return frames
+
+    def preload(self, characters, actions, size):
+        """ Load every facing of the given animations ahead of gameplay """
+        for character in characters:
+            for action in actions:
+                self.get(character, action, size, 'right')
+                self.get(character, action, size, 'left')
+
+    def stats(self):
+        """ Report cache hits, misses and the memory held by the frames """
+        # rise frames share surfaces with the dead frames, count them once
+        surfaces = {id(frame): frame for frames in self.frame_sets.values() for frame in frames}
+        held = sum(frame.get_bytesize() * frame.get_width() * frame.get_height() for frame in surfaces.values())
+
+        return {'hits': self.hits, 'misses': self.misses, 'frame_sets': len(self.frame_sets),
+                'frames': len(surfaces), 'masks': len(self.masks), 'bytes': held}
+
+    def clear(self):
+        """ Drop every cached frame and reset the counters """
+        self.frame_sets.clear()
+        self.masks.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def frame_paths(character, action):
+        """ Get the file paths of an animation in play order """
+        pattern, first, last = FRAME_FILES[(character, action)]
+        return [resource_path(pattern.format(i)) for i in range(first, last + 1)]
+
+    @staticmethod
+    def load_frame(path, size):
+        """ Load and scale a single frame, converted to the display format when there is one """
+        frame = pygame.transform.scale(pygame.image.load(path), size)
+        if pygame.display.get_surface():
+            frame = frame.convert_alpha()
+        return frame
+
+
+# shared by every sprite of the game
+animation_cache = AnimationCache()
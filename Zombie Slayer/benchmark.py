@@ -0,0 +1,111 @@
+import os
+import time
+
+# run without opening a window or an audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import random
+import pygame
+from animation import animation_cache
+from tile_grid import TileGrid
+from sound_bank import sound_bank
+
+
+def benchmark_masks(zombie_counts, frames=120):
+    """ Compare the mask cost per frame of rebuilding masks against looking them up """
+    walk_sprites = animation_cache.get('zombie/boy', 'walk', (62, 62), 'right')
+
+    print('Collision masks, time per frame')
+    print(f'{"zombies":>8} {"from_surface (ms)":>18} {"cached (ms)":>12}')
+    for count in zombie_counts:
+        start = time.perf_counter()
+        for frame in range(frames):
+            for zombie in range(count):
+                pygame.mask.from_surface(walk_sprites[(frame + zombie) % len(walk_sprites)])
+        rebuilt = (time.perf_counter() - start) * 1000 / frames
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            for zombie in range(count):
+                animation_cache.masks[walk_sprites[(frame + zombie) % len(walk_sprites)]]
+        cached = (time.perf_counter() - start) * 1000 / frames
+
+        print(f'{count:>8} {rebuilt:>18.3f} {cached:>12.4f}')
+
+
+def make_platform_tiles(columns, rows):
+    """ Create platform tiles laid out like the tile map, a platform row every 4th row """
+    image = pygame.Surface((31, 31), pygame.SRCALPHA)
+    pygame.draw.rect(image, (255, 255, 255), (0, 0, 31, 20))
+    mask = pygame.mask.from_surface(image)
+
+    tiles = []
+    for i in range(3, rows, 4):
+        for j in range(columns):
+            tile = pygame.sprite.Sprite()
+            tile.image = image
+            tile.mask = mask
+            tile.rect = image.get_rect()
+            tile.rect.topleft = (j * 31, i * 31)
+            tiles.append(tile)
+
+    return tiles
+
+
+def benchmark_platform_collisions(map_sizes, sprite_count=50, frames=60):
+    """ Compare the group scan against the grid index for platform collisions """
+    walk_sprites = animation_cache.get('zombie/boy', 'walk', (62, 62), 'right')
+
+    print(f'Platform collisions for {sprite_count} sprites, time per frame')
+    print(f'{"map":>8} {"tiles":>6} {"group scan (ms)":>16} {"grid (ms)":>10}')
+    for columns, rows in map_sizes:
+        tiles = make_platform_tiles(columns, rows)
+        platform_group = pygame.sprite.Group(tiles)
+        platform_grid = TileGrid(31, tiles)
+
+        sprites = []
+        for i in range(sprite_count):
+            sprite = pygame.sprite.Sprite()
+            sprite.image = walk_sprites[i % len(walk_sprites)]
+            sprite.mask = animation_cache.masks[sprite.image]
+            sprite.rect = sprite.image.get_rect()
+            sprite.rect.topleft = (random.randint(0, columns * 31), random.randint(0, rows * 31))
+            sprites.append(sprite)
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            for sprite in sprites:
+                pygame.sprite.spritecollide(sprite, platform_group, False, pygame.sprite.collide_mask)
+        scanned = (time.perf_counter() - start) * 1000 / frames
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            for sprite in sprites:
+                platform_grid.spritecollide(sprite, pygame.sprite.collide_mask)
+        indexed = (time.perf_counter() - start) * 1000 / frames
+
+        print(f'{columns:>3}x{rows:<4} {len(tiles):>6} {scanned:>16.3f} {indexed:>10.3f}')
+
+
+def report_sounds():
+    """ Report the load time and memory of the sound bank """
+    sound_bank.load(['jump_sound', 'lost_ruby', 'player_hit', 'portal_sound', 'ruby_pickup', 'slash_sound',
+                     'zombie_hit', 'zombie_kick'])
+    stats = sound_bank.stats()
+
+    print(f'Sound bank: {stats["sounds"]} sounds decoded in {stats["load_time"] * 1000:.1f} ms, '
+          f'{stats["bytes"] / 1024:.0f} KiB held')
+
+
+if __name__ == '__main__':
+    pygame.init()
+    pygame.display.set_mode((1240, 713))
+
+    benchmark_masks([1, 10, 25, 50, 100, 200])
+    print()
+    benchmark_platform_collisions([(40, 23), (80, 46), (160, 92), (320, 184)])
+    print()
+    report_sounds()
+
+    pygame.quit()
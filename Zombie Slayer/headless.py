@@ -0,0 +1,145 @@
+import os
+import time
+import random
+import argparse
+import multiprocessing
+from collections import defaultdict
+from functools import partial
+
+# no window and no audio device, set before pygame starts
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from main import Game, Level, tile_map, WINDOW_WIDTH, WINDOW_HEIGHT, SIMULATION_RATE
+from main import bullet_pool, zombie_pool, ruby_pool
+
+
+class HeadlessGame(Game):
+    """A game that never waits for the player, a lost game ends the run"""
+
+    def __init__(self, *args):
+        """Initialize the game"""
+        super().__init__(*args)
+        self.is_over = False
+
+    def load_music(self):
+        """No music without an audio device"""
+
+    def pause_game(self, main_text, sub_text):
+        """Carry on straight away"""
+
+    def check_game_over(self):
+        """End the run when the player dies"""
+        if self.player.health <= 0:
+            self.is_over = True
+
+
+class ScriptedKeyboard:
+    """Input for the player chosen by a seeded script instead of a person"""
+
+    def __init__(self, rng):
+        """Initialize the script"""
+        self.rng = rng
+        self.pressed = defaultdict(bool)
+
+    def get_pressed(self):
+        """Get the keys held down, same as pygame.key.get_pressed"""
+        return self.pressed
+
+    def update(self, player, zombie_group, tick):
+        """Choose the input for the next simulation step"""
+        # pick a new direction every half second
+        if not tick % (SIMULATION_RATE // 2):
+            self.pressed.clear()
+            self.pressed[self.rng.choice([pygame.K_LEFT, pygame.K_RIGHT, None])] = True
+
+        if self.rng.randint(0, SIMULATION_RATE) == 0:
+            player.jump()
+
+        # slash at living zombies close by on the same floor
+        for zombie in zombie_group:
+            if (not zombie.is_dead and abs(zombie.rect.centery - player.rect.centery) < 40
+                    and abs(zombie.rect.centerx - player.rect.centerx) < 300):
+                if self.rng.randint(0, 10) == 0:
+                    player.fire()
+                break
+
+
+def run_simulation(seed, max_frames=SIMULATION_RATE * 300, zombie_creation_time=4, min_zombie_speed=0,
+                   max_zombie_speed=5):
+    """Play one seeded game without a window and return its stats"""
+    random.seed(seed)
+
+    level = Level(tile_map, pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+    game = HeadlessGame(level.player, level.zombie_group, level.platform_group, level.portal_group,
+                        level.bullet_group, level.ruby_group)
+    game.STARTING_ZOMBIE_CREATION_TIME = zombie_creation_time
+    game.zombie_creation_time = zombie_creation_time
+    game.MIN_ZOMBIE_SPEED = min_zombie_speed
+    game.MAX_ZOMBIE_SPEED = max_zombie_speed
+
+    keyboard = ScriptedKeyboard(random.Random(seed))
+    level.player.keyboard = keyboard
+
+    # sprites created during the run, the pools should keep this at zero once warmed up
+    pools = [bullet_pool, zombie_pool, ruby_pool]
+    starting_allocations = sum(pool.allocations for pool in pools)
+    starting_reuses = sum(pool.reuses for pool in pools)
+
+    frames = 0
+    while frames < max_frames and not game.is_over:
+        keyboard.update(level.player, level.zombie_group, frames)
+        level.update()
+        game.update()
+        frames += 1
+
+    results = {'seed': seed, 'frames': frames, 'nights': game.round_number, 'score': game.score,
+               'health': level.player.health, 'zombies': len(level.zombie_group), 'died': game.is_over,
+               'allocations': sum(pool.allocations for pool in pools) - starting_allocations,
+               'reuses': sum(pool.reuses for pool in pools) - starting_reuses}
+
+    # hand the sprites left on the level back to the pools for the next run
+    for sprite_group in level.moving_groups:
+        sprite_group.empty()
+
+    return results
+
+
+def run_batch(seeds, processes=None, **settings):
+    """Run a simulation per seed across a process pool, return the stats and simulated frames per second"""
+    start = time.perf_counter()
+    pool = multiprocessing.Pool(processes)
+    results = pool.map(partial(run_simulation, **settings), seeds)
+
+    # SDL catches SIGTERM in the workers, so let them finish instead of terminating the pool
+    pool.close()
+    pool.join()
+    elapsed = time.perf_counter() - start
+
+    return results, sum(result['frames'] for result in results) / elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Simulate Zombie Slayer nights without a window')
+    parser.add_argument('--runs', type=int, default=8, help='number of seeded games to play')
+    parser.add_argument('--frames', type=int, default=SIMULATION_RATE * 300, help='frame limit of each game')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes, all cores by default')
+    parser.add_argument('--zombie-creation-time', type=int, default=4, help='starting seconds between zombies')
+    parser.add_argument('--min-zombie-speed', type=int, default=0, help='slowest zombie speed, plus the night number')
+    parser.add_argument('--max-zombie-speed', type=int, default=5, help='fastest zombie speed, plus the night number')
+    args = parser.parse_args()
+    if args.min_zombie_speed > args.max_zombie_speed:
+        parser.error('--min-zombie-speed can not be more than --max-zombie-speed')
+
+    results, frames_per_second = run_batch(range(args.runs), args.processes, max_frames=args.frames,
+                                           zombie_creation_time=args.zombie_creation_time,
+                                           min_zombie_speed=args.min_zombie_speed,
+                                           max_zombie_speed=args.max_zombie_speed)
+
+    print(f'{"seed":>6} {"frames":>8} {"nights":>7} {"score":>7} {"died":>5} {"new sprites":>12}')
+    for result in results:
+        print(f'{result["seed"]:>6} {result["frames"]:>8} {result["nights"]:>7} {result["score"]:>7} '
+              f'{str(result["died"]):>5} {result["allocations"]:>12}')
+
+    print(f'Throughput: {frames_per_second:.0f} simulated frames per second')
@@ -0,0 +1,39 @@
+import pygame
+
+
+class LevelLayer(pygame.sprite.Group):
+    """ A group of static tiles, drawn as one surface baked over the background """
+
+    def __init__(self, background, *sprites):
+        """ Initialize the layer """
+        self.background = background
+        self.baked = None
+
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """ Add a tile, the layer is baked again on the next draw """
+        super().add_internal(sprite, layer)
+        self.baked = None
+
+    def remove_internal(self, sprite):
+        """ Remove a tile, the layer is baked again on the next draw """
+        super().remove_internal(sprite)
+        self.baked = None
+
+    def bake(self):
+        """ Draw the background and every tile onto a single surface """
+        self.baked = self.background.copy()
+        for tile in self.sprites():
+            self.baked.blit(tile.image, tile.rect)
+
+        # match the display format so the per frame blit needs no conversion
+        if pygame.display.get_surface():
+            self.baked = self.baked.convert()
+
+    def draw(self, surface):
+        """ Draw the whole layer with a single blit """
+        if self.baked is None:
+            self.bake()
+
+        return [surface.blit(self.baked, (0, 0))]
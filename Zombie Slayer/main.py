@@ -2,6 +2,13 @@ import pygame
 import random
 import os
 import sys
+from animation import animation_cache
+from tile_grid import TileGrid
+from level import LevelLayer
+from text_cache import text_cache, CachedText
+from sound_bank import sound_bank
+from pool import PooledSprite, SpritePool
+from profiler import FrameProfiler, get_csv_path
 
 
 def resource_path(relative_path):
@@ -22,10 +29,22 @@ window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 
 pygame.display.set_caption('Zombie Slayer')
 
-# set FPS and Clock
+# load the zombie frames once, before any zombie spawns
+animation_cache.preload(['zombie/boy', 'zombie/girl'], ['walk', 'dead', 'rise'], (62, 62))
+
+# decode every sound once, the sounds many zombies and rubies play at once get their own channel
+sound_bank.load(['jump_sound', 'lost_ruby', 'player_hit', 'portal_sound', 'ruby_pickup', 'slash_sound',
+                 'zombie_hit', 'zombie_kick'])
+sound_bank.reserve_channels(['portal_sound', 'zombie_hit', 'zombie_kick'])
+
+# set FPS and Clock (FPS only caps rendering, 0 renders uncapped)
 FPS = 60
 clock = pygame.time.Clock()
 
+# the simulation always advances in fixed steps of 1/60 second, timers count these ticks
+SIMULATION_RATE = 60
+STEP_TIME = 1000 / SIMULATION_RATE
+
 
 # define Classes
 class Game:
@@ -35,22 +54,35 @@ class Game:
         """Initialize the game"""
         self.STARTING_TIME = 30
         self.STARTING_ZOMBIE_CREATION_TIME = 4
+        # a zombie walks at a random speed between these plus the night number
+        self.MIN_ZOMBIE_SPEED = 0
+        self.MAX_ZOMBIE_SPEED = 5
 
         # set game values
         self.score = 0
         self.round_number = 1
-        self.frame_count = 0
+        self.tick_count = 0
         self.round_time = self.STARTING_TIME
         self.zombie_creation_time = self.STARTING_ZOMBIE_CREATION_TIME
 
+        # set when a step paused the game, the main loop drops the steps it still owed from before the pause
+        self.was_paused = False
+
         # set fonts
         self.title_font = pygame.font.Font(resource_path('resources/fonts/Poultrygeist.ttf'), 48)
         self.HUD_font = pygame.font.Font(resource_path('resources/fonts/Pixel.ttf'), 24)
 
-        # sounds
-        self.lost_ruby_sound = pygame.mixer.Sound(resource_path('resources/sounds/lost_ruby.wav'))
-        self.pickup_ruby_sound = pygame.mixer.Sound(resource_path('resources/sounds/ruby_pickup.wav'))
-        pygame.mixer.music.load(resource_path('resources/sounds/level_music.wav'))
+        # HUD text, rendered again only when its value changes
+        WHITE = (255, 255, 255)
+        GREEN = (25, 200, 25)
+        self.score_text = CachedText(self.HUD_font, 'Score: {}', True, WHITE)
+        self.health_text = CachedText(self.HUD_font, 'Health: {}', True, WHITE)
+        self.title_text = CachedText(self.title_font, 'Zombie Slayer', True, GREEN)
+        self.round_text = CachedText(self.HUD_font, 'Night: {}', True, WHITE)
+        self.time_text = CachedText(self.HUD_font, 'Sunrise in: {}', True, WHITE)
+
+        # music
+        self.load_music()
 
         # attach groups
         self.player = player
@@ -60,12 +92,16 @@ class Game:
         self.bullet_group = bullet_group
         self.ruby_group = ruby_group
 
+    def load_music(self):
+        """Load the background music"""
+        pygame.mixer.music.load(resource_path('resources/sounds/level_music.wav'))
+
     def update(self):
         """Update the game"""
-        self.frame_count += 1
-        if self.frame_count % FPS == 0:
+        self.tick_count += 1
+        if self.tick_count % SIMULATION_RATE == 0:
             self.round_time -= 1
-            self.frame_count = 0
+            self.tick_count = 0
 
         # check for gameplay collisions
         self.check_collisions()
@@ -81,28 +117,24 @@ class Game:
 
     def draw(self):
         """Draw the game HUD"""
-        # colours
-        WHITE = (255, 255, 255)
-        GREEN = (25, 200, 25)
-
         # text
-        score_text = self.HUD_font.render(f'Score: {self.score}', True, WHITE)
+        score_text = self.score_text.render(self.score)
         score_rect = score_text.get_rect()
         score_rect.topleft = (10, WINDOW_HEIGHT - 50)
 
-        health_text = self.HUD_font.render(f'Health: {self.player.health}', True, WHITE)
+        health_text = self.health_text.render(self.player.health)
         health_rect = health_text.get_rect()
         health_rect.topleft = (10, WINDOW_HEIGHT - 25)
 
-        title_text = self.title_font.render('Zombie Slayer', True, GREEN)
+        title_text = self.title_text.render()
         title_rect = title_text.get_rect()
         title_rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 25)
 
-        round_text = self.HUD_font.render(f'Night: {self.round_number}', True, WHITE)
+        round_text = self.round_text.render(self.round_number)
         round_rect = round_text.get_rect()
         round_rect.topright = (WINDOW_WIDTH - 10, WINDOW_HEIGHT - 50)
 
-        time_text = self.HUD_font.render(f'Sunrise in: {self.round_time}', True, WHITE)
+        time_text = self.time_text.render(self.round_time)
         time_rect = time_text.get_rect()
         time_rect.topright = (WINDOW_WIDTH - 10, WINDOW_HEIGHT - 25)
 
@@ -116,10 +148,12 @@ class Game:
     def add_zombie(self):
         """Add a zombie to the game"""
         # check adding zombie every sec
-        if not self.frame_count % FPS:
+        if not self.tick_count % SIMULATION_RATE:
             # add if creation time is passed
             if not self.round_time % self.zombie_creation_time:
-                zombie = Zombie(self.platform_group, self.portal_group, self.round_number, self.round_number + 5)
+                zombie = zombie_pool.get(self.platform_group, self.portal_group,
+                                         self.round_number + self.MIN_ZOMBIE_SPEED,
+                                         self.round_number + self.MAX_ZOMBIE_SPEED)
                 self.zombie_group.add(zombie)
 
     def check_collisions(self):
@@ -129,7 +163,7 @@ class Game:
         if collision_dict:
             for zombies in collision_dict.values():
                 for zombie in zombies:
-                    zombie.hit_sound.play()
+                    sound_bank.play('zombie_hit')
                     zombie.is_dead = True
                     zombie.animate_death = True
 
@@ -139,23 +173,23 @@ class Game:
             for zombie in collision_list:
                 # is the zombie dead? remove it
                 if zombie.is_dead:
-                    zombie.kick_sound.play()
+                    sound_bank.play('zombie_kick')
                     zombie.kill()
                     self.score += 25
 
-                    ruby = Ruby(self.platform_group, self.portal_group)
+                    ruby = ruby_pool.get(self.platform_group, self.portal_group)
                     self.ruby_group.add(ruby)
                 # not dead? take dmg
                 else:
                     self.player.health -= 20
-                    self.player.hit_sound.play()
+                    sound_bank.play('player_hit')
                     # move the player so he doesnt continually take dmg
                     self.player.pos.x += 150 * zombie.direction
                     self.player.rect.bottomleft = self.player.pos
 
         # player collide with ruby
         if pygame.sprite.spritecollide(self.player, self.ruby_group, True):
-            self.pickup_ruby_sound.play()
+            sound_bank.play('ruby_pickup')
             self.score += 100
             self.player.health += 10
             if self.player.health > self.player.STARTING_HEALTH:
@@ -165,8 +199,10 @@ class Game:
         for zombie in self.zombie_group:
             if not zombie.is_dead:
                 if pygame.sprite.spritecollide(zombie, self.ruby_group, True):
-                    self.lost_ruby_sound.play()
-                    zombie = Zombie(self.platform_group, self.portal_group, self.round_number, self.round_number + 5)
+                    sound_bank.play('lost_ruby')
+                    zombie = zombie_pool.get(self.platform_group, self.portal_group,
+                                         self.round_number + self.MIN_ZOMBIE_SPEED,
+                                         self.round_number + self.MAX_ZOMBIE_SPEED)
                     self.zombie_group.add(zombie)
 
     def check_round_completion(self):
@@ -211,11 +247,11 @@ class Game:
         GREEN = (25, 255, 25)
 
         # create text
-        main_text = self.title_font.render(main_text, True, GREEN)
+        main_text = text_cache.render(self.title_font, main_text, True, GREEN)
         main_rect = main_text.get_rect()
         main_rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
 
-        sub_text = self.title_font.render(sub_text, True, WHITE)
+        sub_text = text_cache.render(self.title_font, sub_text, True, WHITE)
         sub_rect = sub_text.get_rect()
         sub_rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 64)
 
@@ -235,6 +271,10 @@ class Game:
                 if event.type == pygame.QUIT:
                     sys.exit()
 
+        # restart the frame timer so the paused time is not simulated
+        clock.tick()
+        self.was_paused = True
+
     def reset_game(self):
         """Reset the game"""
         # reset game values
@@ -308,155 +348,20 @@ class Player(pygame.sprite.Sprite):
         self.JUMP_SPEED = 18  # HOW HIGH THE PLAYER CAN JUMP
         self.STARTING_HEALTH = 100
 
-        # animation frames
-        self.move_right_sprites = []
-        self.move_left_sprites = []
-        self.idle_right_sprites = []
-        self.idle_left_sprites = []
-        self.jump_right_sprites = []
-        self.jump_left_sprites = []
-        self.attack_right_sprites = []
-        self.attack_left_sprites = []
-
-        # moving
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (1).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (2).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (3).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (4).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (5).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (6).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (7).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (8).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (9).png')),
-                                   (62, 62)))
-        self.move_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/run/Run (10).png')),
-                                   (62, 62)))
-        for sprite in self.move_right_sprites:
-            self.move_left_sprites.append(pygame.transform.flip(sprite, True, False))
-
-        # idling
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (1).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (2).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (3).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (4).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (5).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (6).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (7).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (8).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (9).png')),
-                                   (62, 62)))
-        self.idle_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/idle/Idle (10).png')),
-                                   (62, 62)))
-        for sprite in self.idle_right_sprites:
-            self.idle_left_sprites.append(pygame.transform.flip(sprite, True, False))
-
-        # jumping
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (1).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (2).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (3).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (4).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (5).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (6).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (7).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (8).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (9).png')),
-                                   (62, 62)))
-        self.jump_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/jump/Jump (10).png')),
-                                   (62, 62)))
-        for sprite in self.jump_right_sprites:
-            self.jump_left_sprites.append(pygame.transform.flip(sprite, True, False))
-
-        # attacking
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (1).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (2).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (3).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (4).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (5).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (6).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (7).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (8).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (9).png')),
-                                   (62, 62)))
-        self.attack_right_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/attack/Attack (10).png')),
-                                   (62, 62)))
-        for sprite in self.attack_right_sprites:
-            self.attack_left_sprites.append(pygame.transform.flip(sprite, True, False))
+        # animation frames (shared references into the animation cache)
+        self.move_right_sprites = animation_cache.get('player', 'run', (62, 62), 'right')
+        self.move_left_sprites = animation_cache.get('player', 'run', (62, 62), 'left')
+        self.idle_right_sprites = animation_cache.get('player', 'idle', (62, 62), 'right')
+        self.idle_left_sprites = animation_cache.get('player', 'idle', (62, 62), 'left')
+        self.jump_right_sprites = animation_cache.get('player', 'jump', (62, 62), 'right')
+        self.jump_left_sprites = animation_cache.get('player', 'jump', (62, 62), 'left')
+        self.attack_right_sprites = animation_cache.get('player', 'attack', (62, 62), 'right')
+        self.attack_left_sprites = animation_cache.get('player', 'attack', (62, 62), 'left')
 
         # load and get rect
         self.current_sprite = 0
         self.image = self.idle_right_sprites[self.current_sprite]
+        self.mask = animation_cache.masks[self.image]
         self.rect = self.image.get_rect()
         self.rect.bottomleft = (x, y)
 
@@ -469,11 +374,8 @@ class Player(pygame.sprite.Sprite):
         self.animation_jump = False
         self.animation_fire = False
 
-        # load sounds
-        self.jump_sound = pygame.mixer.Sound(resource_path('resources/sounds/jump_sound.wav'))
-        self.slash_sound = pygame.mixer.Sound(resource_path('resources/sounds/slash_sound.wav'))
-        self.portal_sound = pygame.mixer.Sound(resource_path('resources/sounds/portal_sound.wav'))
-        self.hit_sound = pygame.mixer.Sound(resource_path('resources/sounds/player_hit.wav'))
+        # where the held keys are read from, scripted input can replace it
+        self.keyboard = pygame.key
 
         # kinematic vectors
         self.pos = vector(x, y)
@@ -491,7 +393,7 @@ class Player(pygame.sprite.Sprite):
         self.check_animation()
 
         # update the player mask
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = animation_cache.masks[self.image]
 
     def move(self):
         """Move the player"""
@@ -499,7 +401,7 @@ class Player(pygame.sprite.Sprite):
         self.acceleration = vector(0, self.VERTICAL_ACCELERATION)
 
         # if the user is pressing a key ( change x of acceleration to non-zero
-        keys = pygame.key.get_pressed()
+        keys = self.keyboard.get_pressed()
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             self.acceleration.x = -1 * self.HORIZONTAL_ACCELERATION
             self.animate(self.move_left_sprites, .5)
@@ -530,25 +432,23 @@ class Player(pygame.sprite.Sprite):
         """Check collisions with platforms and portals"""
         # collision check with platform when falling
         if self.velocity.y > 0:
-            collided_platforms = pygame.sprite.spritecollide(self, self.platform_group, False,
-                                                             pygame.sprite.collide_mask)
+            collided_platforms = self.platform_group.spritecollide(self, pygame.sprite.collide_mask)
             if collided_platforms:
                 self.pos.y = collided_platforms[0].rect.top + 5
                 self.velocity.y = 0
 
         # when jumping up
         if self.velocity.y < 0:
-            collided_platforms = pygame.sprite.spritecollide(self, self.platform_group, False,
-                                                             pygame.sprite.collide_mask)
+            collided_platforms = self.platform_group.spritecollide(self, pygame.sprite.collide_mask)
             if collided_platforms:
                 self.velocity.y = 0
-                while pygame.sprite.spritecollide(self, self.platform_group, False, pygame.sprite.collide_mask):
+                while self.platform_group.spritecollide(self, pygame.sprite.collide_mask):
                     self.pos.y += 1
                     self.rect.bottomleft = self.pos
 
         # portals
         if pygame.sprite.spritecollide(self, self.portal_group, False):
-            self.portal_sound.play()
+            sound_bank.play('portal_sound')
             # which portal to teleport to
             # left and right
             if self.pos.x > WINDOW_WIDTH // 2:
@@ -582,15 +482,15 @@ class Player(pygame.sprite.Sprite):
     def jump(self):
         """Jump if on a platform"""
         # jump only if on a platform
-        if pygame.sprite.spritecollide(self, self.platform_group, False):
-            self.jump_sound.play()
+        if self.platform_group.spritecollide(self):
+            sound_bank.play('jump_sound')
             self.velocity.y = -1 * self.JUMP_SPEED
             self.animation_jump = True
 
     def fire(self):
         """Fire a bullet"""
-        self.slash_sound.play()
-        Bullet(self.rect.centerx, self.rect.centery, self.bullet_group, self)
+        sound_bank.play('slash_sound')
+        bullet_pool.get(self.rect.centerx, self.rect.centery, self.bullet_group, self)
         self.animation_fire = True
 
     def reset(self):
@@ -611,31 +511,41 @@ class Player(pygame.sprite.Sprite):
         self.image = sprite_list[int(self.current_sprite)]
 
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(PooledSprite):
     """A projectile launched by the player"""
 
-    def __init__(self, x, y, bullet_group, player):
-        """Initialize the bullet"""
+    def __init__(self):
+        """Initialize the bullet, it is placed by reset"""
         super().__init__()
 
         # set constants
-        self.VELOCITY = 20
+        self.SPEED = 20
         self.RANGE = 450
 
-        # load img
+        # images shared by every bullet
+        self.right_image = animation_cache.get('player', 'slash', (31, 31), 'right')[0]
+        self.left_image = animation_cache.get('player', 'slash', (31, 31), 'left')[0]
+
+        self.image = self.right_image
+        self.rect = self.image.get_rect()
+
+        self.VELOCITY = self.SPEED
+        self.starting_x = 0
+
+    def reset(self, x, y, bullet_group, player):
+        """Launch the bullet from a position in the direction the player moves"""
         if player.velocity.x > 0:
-            self.image = pygame.transform.scale(pygame.image.load(resource_path('resources/images/player/slash.png')),
-                                                (31, 31))
+            self.image = self.right_image
+            self.VELOCITY = self.SPEED
         else:
-            self.image = pygame.transform.scale(
-                pygame.transform.flip(pygame.image.load(resource_path('resources/images/player/slash.png')), True,
-                                      False), (31, 31))
-            self.VELOCITY = -1 * self.VELOCITY
+            self.image = self.left_image
+            self.VELOCITY = -1 * self.SPEED
 
-        self.rect = self.image.get_rect()
         self.rect.center = (x, y)
 
         self.starting_x = x
+        # a reused bullet must not slide from where it was last drawn
+        self.previous_topleft = self.rect.topleft
 
         bullet_group.add(self)
 
@@ -648,128 +558,34 @@ class Bullet(pygame.sprite.Sprite):
             self.kill()
 
 
-class Zombie(pygame.sprite.Sprite):
+class Zombie(PooledSprite):
     """An enemy class"""
 
-    def __init__(self, platform_group, portal_group, min_speed, max_speed):
-        """Initialize the zombie"""
+    def __init__(self):
+        """Initialize the zombie, it is placed by reset"""
         super().__init__()
 
         # set constants
         self.VERTICAL_ACCELERATION = 3  # gravity
         self.RISE_TIME = 2
 
-        # animation frames
-        self.walk_right_sprites = []
-        self.walk_left_sprites = []
-        self.die_right_sprites = []
-        self.die_left_sprites = []
-        self.rise_right_sprites = []
-        self.rise_left_sprites = []
+        # kinematic vectors, kept and overwritten on reset
+        self.pos = vector(0, 0)
+        self.velocity = vector(0, 0)
+        self.acceleration = vector(0, self.VERTICAL_ACCELERATION)
 
+    def reset(self, platform_group, portal_group, min_speed, max_speed):
+        """Bring the zombie in from above with a random look, direction and speed"""
+        # animation frames (shared references into the animation cache)
         gender = random.randint(0, 1)
-        if gender:
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (1).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (2).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (3).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (4).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (5).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (6).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (7).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (8).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (9).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/walk/Walk (10).png')), (62, 62)))
-
-            for sprite in self.walk_right_sprites:
-                self.walk_left_sprites.append(pygame.transform.flip(sprite, True, False))
-
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (1).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (2).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (3).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (4).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (5).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (6).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (7).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (8).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (9).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/girl/dead/Dead (10).png')), (62, 62)))
-
-            for sprite in self.die_right_sprites:
-                self.die_left_sprites.append(pygame.transform.flip(sprite, True, False))
-
-            self.rise_right_sprites = list(reversed(self.die_right_sprites))
-            self.rise_left_sprites = list(reversed(self.die_left_sprites))
-        else:
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (1).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (2).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (3).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (4).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (5).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (6).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (7).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (8).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (9).png')), (62, 62)))
-            self.walk_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/walk/Walk (10).png')), (62, 62)))
-
-            for sprite in self.walk_right_sprites:
-                self.walk_left_sprites.append(pygame.transform.flip(sprite, True, False))
-
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (1).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (2).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (3).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (4).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (5).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (6).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (7).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (8).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (9).png')), (62, 62)))
-            self.die_right_sprites.append(pygame.transform.scale(
-                pygame.image.load(resource_path('resources/images/zombie/boy/dead/Dead (10).png')), (62, 62)))
-
-            for sprite in self.die_right_sprites:
-                self.die_left_sprites.append(pygame.transform.flip(sprite, True, False))
-
-            self.rise_right_sprites = list(reversed(self.die_right_sprites))
-            self.rise_left_sprites = list(reversed(self.die_left_sprites))
+        character = 'zombie/girl' if gender else 'zombie/boy'
+
+        self.walk_right_sprites = animation_cache.get(character, 'walk', (62, 62), 'right')
+        self.walk_left_sprites = animation_cache.get(character, 'walk', (62, 62), 'left')
+        self.die_right_sprites = animation_cache.get(character, 'dead', (62, 62), 'right')
+        self.die_left_sprites = animation_cache.get(character, 'dead', (62, 62), 'left')
+        self.rise_right_sprites = animation_cache.get(character, 'rise', (62, 62), 'right')
+        self.rise_left_sprites = animation_cache.get(character, 'rise', (62, 62), 'left')
 
         # load img
         self.direction = random.choice([-1, 1])
@@ -779,9 +595,11 @@ class Zombie(pygame.sprite.Sprite):
             self.image = self.walk_left_sprites[self.current_sprite]
         else:
             self.image = self.walk_right_sprites[self.current_sprite]
+        self.mask = animation_cache.masks[self.image]
 
         self.rect = self.image.get_rect()
         self.rect.bottomleft = (random.randint(100, WINDOW_WIDTH - 100), -100)
+        self.previous_topleft = self.rect.topleft
 
         # attach sprite group
         self.platform_group = platform_group
@@ -791,20 +609,14 @@ class Zombie(pygame.sprite.Sprite):
         self.animate_death = False
         self.animate_rise = False
 
-        # load sounds
-        self.hit_sound = pygame.mixer.Sound(resource_path('resources/sounds/zombie_hit.wav'))
-        self.kick_sound = pygame.mixer.Sound(resource_path('resources/sounds/zombie_kick.wav'))
-        self.portal_sound = pygame.mixer.Sound(resource_path('resources/sounds/portal_sound.wav'))
-
         # kinematic vectors
-        self.pos = vector(self.rect.x, self.rect.y)
-        self.velocity = vector(self.direction * random.randint(min_speed, max_speed), 0)
-        self.acceleration = vector(0, self.VERTICAL_ACCELERATION)
+        self.pos.update(self.rect.x, self.rect.y)
+        self.velocity.update(self.direction * random.randint(min_speed, max_speed), 0)
 
         # initial zombie values
         self.is_dead = False
         self.round_time = 0
-        self.frame_count = 0
+        self.tick_count = 0
 
     def update(self):
         """Update the zombie"""
@@ -814,8 +626,8 @@ class Zombie(pygame.sprite.Sprite):
 
         # when the zombie raise
         if self.is_dead:
-            self.frame_count += 1
-            if not self.frame_count % FPS:
+            self.tick_count += 1
+            if not self.tick_count % SIMULATION_RATE:
                 self.round_time += 1
                 if self.round_time == self.RISE_TIME:
                     self.animate_rise = True
@@ -823,7 +635,7 @@ class Zombie(pygame.sprite.Sprite):
                     self.current_sprite = 0
 
         # update mask
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = animation_cache.masks[self.image]
 
     def move(self):
         """Move the zombie"""
@@ -851,14 +663,14 @@ class Zombie(pygame.sprite.Sprite):
         """Check collisions with platforms and portals"""
         # collision check with platform when falling
 
-        collided_platforms = pygame.sprite.spritecollide(self, self.platform_group, False, pygame.sprite.collide_mask)
+        collided_platforms = self.platform_group.spritecollide(self, pygame.sprite.collide_mask)
         if collided_platforms:
             self.pos.y = collided_platforms[0].rect.top + 1
             self.velocity.y = 0
 
         # portals
         if pygame.sprite.spritecollide(self, self.portal_group, False):
-            self.portal_sound.play()
+            sound_bank.play('portal_sound')
             # which portal to teleport to
             # left and right
             if self.pos.x > WINDOW_WIDTH // 2:
@@ -899,7 +711,7 @@ class Zombie(pygame.sprite.Sprite):
             if self.animate_rise:
                 self.animate_rise = False
                 self.is_dead = False
-                self.frame_count = 0
+                self.tick_count = 0
                 self.round_time = 0
 
         self.image = sprite_list[int(self.current_sprite)]
@@ -912,22 +724,7 @@ class RubyMaker(pygame.sprite.Sprite):
         """Initialize the Ruby maker"""
         super().__init__()
         # animation frames
-        self.ruby_sprites = []
-
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile000.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile001.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile002.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile003.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile004.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile005.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile006.png')), (62, 62)))
+        self.ruby_sprites = animation_cache.get('ruby', 'spin', (62, 62))
 
         # load and get rect
         self.current_sprite = 0
@@ -952,11 +749,11 @@ class RubyMaker(pygame.sprite.Sprite):
         self.image = sprite_list[int(self.current_sprite)]
 
 
-class Ruby(pygame.sprite.Sprite):
+class Ruby(PooledSprite):
     """A Ruby Class"""
 
-    def __init__(self, platform_group, portal_group):
-        """Initialize the Ruby"""
+    def __init__(self):
+        """Initialize the Ruby, it is placed by reset"""
         super().__init__()
 
         # constants
@@ -964,40 +761,32 @@ class Ruby(pygame.sprite.Sprite):
         self.HORIZONTAL_VELOCITY = 5
 
         # animation frames
-        self.ruby_sprites = []
-
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile000.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile001.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile002.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile003.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile004.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile005.png')), (62, 62)))
-        self.ruby_sprites.append(
-            pygame.transform.scale(pygame.image.load(resource_path('resources/images/ruby/tile006.png')), (62, 62)))
+        self.ruby_sprites = animation_cache.get('ruby', 'spin', (62, 62))
+
+        self.image = self.ruby_sprites[0]
+        self.rect = self.image.get_rect()
+
+        # kinematic vectors, kept and overwritten on reset
+        self.pos = vector(0, 0)
+        self.velocity = vector(0, 0)
+        self.acceleration = vector(0, self.VERTICAL_ACCELERATION)
 
+    def reset(self, platform_group, portal_group):
+        """Drop the Ruby from the top middle in a random direction"""
         # load img
         self.current_sprite = 0
         self.image = self.ruby_sprites[self.current_sprite]
-        self.rect = self.image.get_rect()
+        self.mask = animation_cache.masks[self.image]
         self.rect.bottomleft = (WINDOW_WIDTH // 2, 100)
+        self.previous_topleft = self.rect.topleft
 
         # attach groups
         self.platform_group = platform_group
         self.portal_group = portal_group
 
-        # sounds
-        self.portal_sound = pygame.mixer.Sound(resource_path('resources/sounds/portal_sound.wav'))
-
         # kinematic vectors
-        self.pos = vector(self.rect.x, self.rect.y)
-        self.velocity = vector(random.choice([-1, 1]) * self.HORIZONTAL_VELOCITY, 0)
-        self.acceleration = vector(0, self.VERTICAL_ACCELERATION)
+        self.pos.update(self.rect.x, self.rect.y)
+        self.velocity.update(random.choice([-1, 1]) * self.HORIZONTAL_VELOCITY, 0)
 
     def update(self):
         """Update the Ruby"""
@@ -1021,20 +810,20 @@ class Ruby(pygame.sprite.Sprite):
         self.rect.bottomleft = self.pos
 
         # update mask
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = animation_cache.masks[self.image]
 
     def check_collisions(self):
         """Check for collisions"""
         # collision check with platform when falling
 
-        collided_platforms = pygame.sprite.spritecollide(self, self.platform_group, False, pygame.sprite.collide_mask)
+        collided_platforms = self.platform_group.spritecollide(self, pygame.sprite.collide_mask)
         if collided_platforms:
             self.pos.y = collided_platforms[0].rect.top + 1
             self.velocity.y = 0
 
         # portals
         if pygame.sprite.spritecollide(self, self.portal_group, False, pygame.sprite.collide_mask):
-            self.portal_sound.play()
+            sound_bank.play('portal_sound')
             # which portal to teleport to
             # left and right
             if self.pos.x > WINDOW_WIDTH // 2:
@@ -1066,148 +855,13 @@ class Portal(pygame.sprite.Sprite):
         """Initialize the portal"""
         super().__init__()
 
-        # animation framess
-        self.portal_sprites = []
-
-        # portal animation
-        if colour == 'green':
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile000.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile001.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile002.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile003.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile004.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile005.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile006.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile007.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile008.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile009.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile010.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile011.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile012.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile013.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile014.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile015.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile016.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile017.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile018.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile019.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile020.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/green/tile021.png')),
-                                       (70, 70)))
-        else:
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile000.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile001.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile002.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile003.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile004.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile005.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile006.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile007.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile008.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile009.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile010.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile011.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile012.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile013.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile014.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile015.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile016.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile017.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile018.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile019.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile020.png')),
-                                       (70, 70)))
-            self.portal_sprites.append(
-                pygame.transform.scale(pygame.image.load(resource_path('resources/images/portals/purple/tile021.png')),
-                                       (70, 70)))
+        # animation frames
+        self.portal_sprites = animation_cache.get(f'portal/{colour}', 'spin', (70, 70))
 
         # load and get rect
         self.current_sprite = random.randint(0, len(self.portal_sprites) - 1)
         self.image = self.portal_sprites[self.current_sprite]
+        self.mask = animation_cache.masks[self.image]
         self.rect = self.image.get_rect()
         self.rect.bottomleft = (x, y)
 
@@ -1217,6 +871,7 @@ class Portal(pygame.sprite.Sprite):
     def update(self):
         """Update the portal"""
         self.animate(self.portal_sprites, .2)
+        self.mask = animation_cache.masks[self.image]
 
     def animate(self, sprite_list, speed):
         """Animate the portal"""
@@ -1228,17 +883,94 @@ class Portal(pygame.sprite.Sprite):
         self.image = sprite_list[int(self.current_sprite)]
 
 
-# create sprite groups
-main_tile_group = pygame.sprite.Group()
-platform_group = pygame.sprite.Group()
+# sprites that come and go during a night are reused, enough are made up front for a busy night
+bullet_pool = SpritePool(Bullet)
+bullet_pool.fill(10)
+zombie_pool = SpritePool(Zombie)
+zombie_pool.fill(30)
+ruby_pool = SpritePool(Ruby)
+ruby_pool.fill(10)
+
+
+class Level:
+    """The sprites built from a tile map"""
+
+    def __init__(self, tile_map, background):
+        """Create the sprite groups and fill them from the tile map"""
+        # create sprite groups (static tiles are baked with the background, ruby makers are animated)
+        self.static_tile_group = LevelLayer(background)
+        self.main_tile_group = pygame.sprite.Group()
+        self.platform_group = TileGrid(31)
+
+        self.player_group = pygame.sprite.Group()
+        self.bullet_group = pygame.sprite.Group()
+
+        self.zombie_group = pygame.sprite.Group()
+
+        self.portal_group = pygame.sprite.Group()
+        self.ruby_group = pygame.sprite.Group()
+
+        # sprites drawn between simulation steps
+        self.moving_groups = [self.player_group, self.bullet_group, self.zombie_group, self.ruby_group]
+
+        # generate tile objects from the tile map
+        for i in range(len(tile_map)):
+            for j in range(len(tile_map[i])):
+                # dirt
+                if tile_map[i][j] == 1:
+                    Tile(j * 31, i * 31, 1, self.static_tile_group)
+                # platform
+                elif tile_map[i][j] == 2:
+                    Tile(j * 31, i * 31, 2, self.static_tile_group, self.platform_group)
+                elif tile_map[i][j] == 3:
+                    Tile(j * 31, i * 31, 3, self.static_tile_group, self.platform_group)
+                elif tile_map[i][j] == 4:
+                    Tile(j * 31, i * 31, 4, self.static_tile_group, self.platform_group)
+                elif tile_map[i][j] == 5:
+                    Tile(j * 31, i * 31, 5, self.static_tile_group, self.platform_group)
+                # ruby maker
+                elif tile_map[i][j] == 6:
+                    RubyMaker(j * 31, i * 31, self.main_tile_group)
+                # portals
+                elif tile_map[i][j] == 7:
+                    Portal(j * 31, i * 31, 'green', self.portal_group)
+                elif tile_map[i][j] == 8:
+                    Portal(j * 31, i * 31, 'purple', self.portal_group)
+                # player
+                elif tile_map[i][j] == 9:
+                    self.player = Player(j * 31 - 31, i * 31 + 31, self.platform_group, self.portal_group,
+                                         self.bullet_group)
+                    self.player_group.add(self.player)
+
+    def update(self):
+        """Advance every sprite by one simulation step"""
+        self.main_tile_group.update()
+        self.portal_group.update()
+        self.player_group.update()
+        self.bullet_group.update()
+        self.zombie_group.update()
+        self.ruby_group.update()
+
+
+def save_positions(sprite_groups):
+    """Remember where the sprites are before a simulation step"""
+    for sprite_group in sprite_groups:
+        for sprite in sprite_group:
+            sprite.previous_topleft = sprite.rect.topleft
+
 
-player_group = pygame.sprite.Group()
-bullet_group = pygame.sprite.Group()
+def draw_interpolated(sprite_group, surface, alpha):
+    """Draw the sprites between their last two simulated positions"""
+    for sprite in sprite_group:
+        x, y = sprite.rect.topleft
+        previous_x, previous_y = getattr(sprite, 'previous_topleft', (x, y))
 
-zombie_group = pygame.sprite.Group()
+        # wrapping around or teleporting, don't slide across the screen
+        if abs(x - previous_x) > 100 or abs(y - previous_y) > 100:
+            previous_x, previous_y = x, y
+
+        surface.blit(sprite.image, (previous_x + (x - previous_x) * alpha, previous_y + (y - previous_y) * alpha))
 
-portal_group = pygame.sprite.Group()
-ruby_group = pygame.sprite.Group()
 
 # create the tile map
 # 0 -> no tile, 1 -> dirt, 2-5 -> platforms, 6 -> ruby maker, 7-8 -> portal, 9 -> player
@@ -1292,88 +1024,94 @@ tile_map = [
      1, 1]
 ]
 
-# generate tile objects from the tile map
-for i in range(len(tile_map)):
-    for j in range(len(tile_map[i])):
-        # dirt
-        if tile_map[i][j] == 1:
-            Tile(j * 31, i * 31, 1, main_tile_group)
-        # platform
-        elif tile_map[i][j] == 2:
-            Tile(j * 31, i * 31, 2, main_tile_group, platform_group)
-        elif tile_map[i][j] == 3:
-            Tile(j * 31, i * 31, 3, main_tile_group, platform_group)
-        elif tile_map[i][j] == 4:
-            Tile(j * 31, i * 31, 4, main_tile_group, platform_group)
-        elif tile_map[i][j] == 5:
-            Tile(j * 31, i * 31, 5, main_tile_group, platform_group)
-        # ruby maker
-        elif tile_map[i][j] == 6:
-            RubyMaker(j * 31, i * 31, main_tile_group)
-        # portals
-        elif tile_map[i][j] == 7:
-            Portal(j * 31, i * 31, 'green', portal_group)
-        elif tile_map[i][j] == 8:
-            Portal(j * 31, i * 31, 'purple', portal_group)
-        # player
-        elif tile_map[i][j] == 9:
-            player = Player(j * 31 - 31, i * 31 + 31, platform_group, portal_group, bullet_group)
-            player_group.add(player)
-
-# load background image
-bg_img = pygame.transform.scale(pygame.image.load(resource_path('resources/images/background.png')),
-                                (WINDOW_WIDTH, WINDOW_HEIGHT))
-bg_rect = bg_img.get_rect()
-bg_rect.topleft = (0, 0)
-
-# create a game
-game = Game(player, zombie_group, platform_group, portal_group, bullet_group, ruby_group)
-game.pause_game("Zombie Slayer", "Press 'Enter' to Begin")
-pygame.mixer.music.play(-1)
-
-# main game loop
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                running = False
-            if event.key == pygame.K_SPACE:
-                player.jump()
-            if event.key in [pygame.K_UP, pygame.K_w]:
-                player.fire()
-
-    # blitting the background
-    window.blit(bg_img, bg_rect)
 
-    # draw tiles and update
-    main_tile_group.update()
-    main_tile_group.draw(window)
-
-    portal_group.update()
-    portal_group.draw(window)
-
-    player_group.update()
-    player_group.draw(window)
-
-    bullet_group.update()
-    bullet_group.draw(window)
-
-    zombie_group.update()
-    zombie_group.draw(window)
-
-    ruby_group.update()
-    ruby_group.draw(window)
+def main():
+    """Run the game"""
+    # load background image
+    bg_img = pygame.transform.scale(pygame.image.load(resource_path('resources/images/background.png')),
+                                    (WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    # create the level and a game
+    level = Level(tile_map, bg_img)
+    player = level.player
+    game = Game(player, level.zombie_group, level.platform_group, level.portal_group, level.bullet_group,
+                level.ruby_group)
+    game.pause_game("Zombie Slayer", "Press 'Enter' to Begin")
+    pygame.mixer.music.play(-1)
+
+    # fixed time step state, at most a quarter second is caught up after a slow frame
+    MAX_ACCUMULATED_TIME = 250
+    accumulated_time = 0
+
+    # F3 shows frame times, '--profile-csv <file>' saves them
+    profiler = FrameProfiler(get_csv_path())
+
+    # main game loop
+    running = True
+    while running:
+        profiler.start_frame()
+        for event in pygame.event.get():
+            profiler.handle_event(event)
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                if event.key == pygame.K_SPACE:
+                    player.jump()
+                if event.key in [pygame.K_UP, pygame.K_w]:
+                    player.fire()
+        profiler.mark('events')
+
+        # run as many fixed simulation steps as the elapsed time holds
+        accumulated_time += clock.tick(FPS)
+        profiler.mark('wait')
+        accumulated_time = min(accumulated_time, MAX_ACCUMULATED_TIME)
+        while accumulated_time >= STEP_TIME:
+            save_positions(level.moving_groups)
+
+            level.update()
+            profiler.mark('update')
+            game.update()
+            profiler.mark('collision')
+
+            accumulated_time -= STEP_TIME
+
+            # start over after a pause instead of catching up in one frame, and time the frame from here so the
+            # wait for the player is not counted
+            if game.was_paused:
+                game.was_paused = False
+                accumulated_time = 0
+                profiler.start_frame()
+
+        # how far the next step has progressed
+        alpha = accumulated_time / STEP_TIME
+
+        # blitting the background and the static tiles
+        level.static_tile_group.draw(window)
+
+        # draw animated tiles
+        level.main_tile_group.draw(window)
+        level.portal_group.draw(window)
+
+        # draw the moving sprites between their last two positions
+        for sprite_group in level.moving_groups:
+            draw_interpolated(sprite_group, window, alpha)
+
+        # draw the game HUD and the profiler overlay
+        game.draw()
+        profiler.draw(window)
+        profiler.mark('draw')
+
+        # update display
+        pygame.display.update()
+        profiler.mark('flip')
+        profiler.end_frame()
 
-    # update and draw the game
-    game.update()
-    game.draw()
+    # quitting
+    profiler.close()
+    pygame.quit()
 
-    # update display and tick the clock
-    pygame.display.update()
-    clock.tick(FPS)
 
-# quitting
-pygame.quit()
+if __name__ == '__main__':
+    main()
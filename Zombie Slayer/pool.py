@@ -0,0 +1,67 @@
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """ A sprite that goes back to its pool once it is removed from its last group """
+
+    pool = None
+
+    def remove_internal(self, group):
+        """ Remove the sprite from a group, release it if it is in no group anymore """
+        super().remove_internal(group)
+        if self.pool is not None and not self.alive():
+            self.pool.release(self)
+
+    def kill(self):
+        """ Remove the sprite from all its groups and release it, kill skips remove_internal """
+        was_alive = self.alive()
+        super().kill()
+        if self.pool is not None and was_alive:
+            self.pool.release(self)
+
+
+class SpritePool:
+    """ Keeps removed sprites and resets them instead of creating new ones """
+
+    def __init__(self, sprite_class):
+        """ Initialize the pool, the sprite class must be creatable without arguments and have a reset method """
+        self.sprite_class = sprite_class
+        self.free_sprites = []
+
+        self.allocations = 0
+        self.reuses = 0
+        self.peak_in_use = 0
+
+    def create(self):
+        """ Create a new sprite that belongs to this pool """
+        sprite = self.sprite_class()
+        sprite.pool = self
+        self.allocations += 1
+        return sprite
+
+    def fill(self, count):
+        """ Create sprites ahead of time until the pool holds count free sprites """
+        while len(self.free_sprites) < count:
+            self.free_sprites.append(self.create())
+
+    def get(self, *args):
+        """ Get a free sprite, or a new one if there is none, reset with the arguments """
+        if self.free_sprites:
+            sprite = self.free_sprites.pop()
+            self.reuses += 1
+        else:
+            sprite = self.create()
+
+        self.peak_in_use = max(self.peak_in_use, self.allocations - len(self.free_sprites))
+
+        sprite.reset(*args)
+        return sprite
+
+    def release(self, sprite):
+        """ Take back a sprite that left the game """
+        self.free_sprites.append(sprite)
+
+    def stats(self):
+        """ Report how many sprites were created, reused, are free and are in use """
+        return {'allocations': self.allocations, 'reuses': self.reuses, 'free': len(self.free_sprites),
+                'in_use': self.allocations - len(self.free_sprites), 'peak_in_use': self.peak_in_use}
@@ -0,0 +1,62 @@
+import pygame
+import os
+import sys
+import time
+
+
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(
+        os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+class SoundBank:
+    """ Decodes every sound once and hands out the shared Sound objects """
+
+    def __init__(self):
+        """ Initialize the bank """
+        # name -> decoded sound
+        self.sounds = {}
+        # name -> channel kept for that sound only
+        self.channels = {}
+
+        self.load_time = 0
+
+    def load(self, names):
+        """ Decode the sounds in resources/sounds, by file name without '.wav' """
+        start = time.perf_counter()
+        for name in names:
+            if name not in self.sounds:
+                self.sounds[name] = pygame.mixer.Sound(resource_path(f'resources/sounds/{name}.wav'))
+
+        self.load_time += time.perf_counter() - start
+
+    def reserve_channels(self, names):
+        """ Give each sound its own channel, so many sprites playing it at once only restart it """
+        pygame.mixer.set_reserved(len(names))
+        for i, name in enumerate(names):
+            self.channels[name] = pygame.mixer.Channel(i)
+
+    def get(self, name):
+        """ Get the shared sound """
+        return self.sounds[name]
+
+    def play(self, name):
+        """ Play a sound, on its own channel if it has one """
+        if name in self.channels:
+            self.channels[name].play(self.sounds[name])
+        else:
+            self.sounds[name].play()
+
+    def stats(self):
+        """ Report how many sounds are held, how long they took to load and their memory """
+        frequency, size, channels = pygame.mixer.get_init()
+        held = sum(int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+                   for sound in self.sounds.values())
+
+        return {'sounds': len(self.sounds), 'load_time': self.load_time, 'bytes': held}
+
+
+# shared by every sprite of the game
+sound_bank = SoundBank()
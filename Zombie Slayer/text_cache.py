@@ -0,0 +1,76 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """ A bounded least recently used cache of rendered text surfaces """
+
+    def __init__(self, max_size=128):
+        """ Initialize the cache """
+        self.max_size = max_size
+
+        # (font, text, colour, antialias, background) -> rendered surface
+        self.surfaces = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        # renders of bound text served without a lookup, kept apart so the hit rate only covers lookups
+        self.reuses = 0
+
+    def render(self, font, text, antialias, colour, background=None):
+        """ Same as font.render, the text is only rendered if it is not cached yet """
+        key = (font, text, colour, antialias, background)
+        if key in self.surfaces:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return self.surfaces[key]
+
+        self.misses += 1
+        surface = font.render(text, antialias, colour, background)
+        self.surfaces[key] = surface
+
+        # drop the least recently used text
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def stats(self):
+        """ Report hits, misses, reuses of bound text and the hit rate of the cache """
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0
+
+        return {'hits': self.hits, 'misses': self.misses, 'reuses': self.reuses, 'size': len(self.surfaces),
+                'hit_rate': hit_rate}
+
+
+# shared by all the text of the game
+text_cache = TextCache()
+
+
+class CachedText:
+    """ A text bound to a value, rendered again only when the value changes """
+
+    def __init__(self, font, template, antialias, colour, background=None, cache=text_cache):
+        """ Initialize the text, the template is formatted with the value, e.g. 'Score: {}' """
+        self.font = font
+        self.template = template
+        self.antialias = antialias
+        self.colour = colour
+        self.background = background
+        self.cache = cache
+
+        self.value = None
+        self.surface = None
+
+    def render(self, value=None):
+        """ Get the surface of the text for the value """
+        if self.surface is not None and value == self.value:
+            # served without looking in the cache
+            self.cache.reuses += 1
+            return self.surface
+
+        self.value = value
+        self.surface = self.cache.render(self.font, self.template.format(value), self.antialias,
+                                         self.colour, self.background)
+
+        return self.surface
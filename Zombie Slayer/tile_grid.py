@@ -0,0 +1,62 @@
+import pygame
+
+
+class TileGrid(pygame.sprite.Group):
+    """ A group of static tiles indexed by grid cell, so collision checks only test nearby tiles """
+
+    def __init__(self, tile_size, *sprites):
+        """ Initialize the grid """
+        self.tile_size = tile_size
+
+        # (column, row) -> tiles overlapping that cell
+        self.cells = {}
+        self.is_indexed = False
+
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """ Add a tile, the index is rebuilt on the next query """
+        super().add_internal(sprite, layer)
+        self.is_indexed = False
+
+    def remove_internal(self, sprite):
+        """ Remove a tile, the index is rebuilt on the next query """
+        super().remove_internal(sprite)
+        self.is_indexed = False
+
+    def build_index(self):
+        """ Put every tile in the cells its rect covers """
+        self.cells = {}
+        for tile in self.sprites():
+            for cell in self.cells_under(tile.rect):
+                self.cells.setdefault(cell, []).append(tile)
+
+        self.is_indexed = True
+
+    def cells_under(self, rect):
+        """ Get the grid cells a rect overlaps, row by row """
+        first_column, last_column = rect.left // self.tile_size, (rect.right - 1) // self.tile_size
+        first_row, last_row = rect.top // self.tile_size, (rect.bottom - 1) // self.tile_size
+
+        return [(column, row) for row in range(first_row, last_row + 1)
+                for column in range(first_column, last_column + 1)]
+
+    def tiles_near(self, rect):
+        """ Get the tiles in the cells a rect overlaps, row by row """
+        if not self.is_indexed:
+            self.build_index()
+
+        tiles = []
+        for cell in self.cells_under(rect):
+            for tile in self.cells.get(cell, ()):
+                if tile not in tiles:
+                    tiles.append(tile)
+
+        return tiles
+
+    def spritecollide(self, sprite, collided=None):
+        """ Same as pygame.sprite.spritecollide without dokill, testing only the tiles near the sprite """
+        if collided is None:
+            return [tile for tile in self.tiles_near(sprite.rect) if sprite.rect.colliderect(tile.rect)]
+
+        return [tile for tile in self.tiles_near(sprite.rect) if collided(sprite, tile)]